@@ -0,0 +1,225 @@
+"""
+Synthetic-scale benchmark for BaseCRUD / ArticleCRUD against a local mongod.
+
+    python -m benchmarks.database_benchmark --articles 100000 --output bench_results.json
+
+Generates realistic Article documents (all sources, three years of publish
+dates, log-normal body sizes) into a dedicated database, then measures
+throughput and p50/p99 latency of the main data-layer operations and writes
+the results as JSON. The benchmark database is dropped first unless --keep.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import string
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List
+
+from src.database.config import DatabaseConfig
+from src.database.crud.article_crud import ArticleCRUD
+from src.models.article import Article
+from src.models.enums import NewsSource
+
+SOURCE_WEIGHTS = {
+    NewsSource.OPENAI: 30,
+    NewsSource.ANTHROPIC: 20,
+    NewsSource.META: 20,
+    NewsSource.GROQ: 15,
+    NewsSource.DEEPSEEK: 10,
+    NewsSource.GROK: 5,
+}
+SOURCE_DOMAINS = {
+    NewsSource.OPENAI: 'https://openai.com/index/',
+    NewsSource.ANTHROPIC: 'https://www.anthropic.com/news/',
+    NewsSource.META: 'https://ai.meta.com/blog/',
+    NewsSource.GROQ: 'https://groq.com/',
+    NewsSource.DEEPSEEK: 'https://www.deepseekv3.com/en/blog/',
+    NewsSource.GROK: 'https://x.ai/blog/',
+}
+
+
+class ArticleFactory:
+    def __init__(self, seed: int):
+        self.random = random.Random(seed)
+        self.words = [
+            "".join(self.random.choices(string.ascii_lowercase, k=self.random.randint(2, 10)))
+            for _ in range(5000)
+        ]
+        self.sources = list(SOURCE_WEIGHTS)
+        self.weights = list(SOURCE_WEIGHTS.values())
+        self.now = datetime.now(timezone.utc)
+        self.sequence = 0
+
+    def _text(self, size: int) -> str:
+        paragraphs = []
+        length = 0
+        while length < size:
+            paragraph = " ".join(self.random.choices(self.words, k=self.random.randint(40, 120)))
+            paragraphs.append(paragraph)
+            length += len(paragraph) + 2
+        return "\n\n".join(paragraphs)[:size]
+
+    def article(self) -> Article:
+        self.sequence += 1
+        source = self.random.choices(self.sources, self.weights)[0]
+        title = " ".join(self.random.choices(self.words, k=self.random.randint(4, 12))).capitalize()
+        # Median body ~5 KB with a long tail, capped at 200 KB like the extractor
+        size = min(200_000, max(300, int(self.random.lognormvariate(8.5, 0.8))))
+        return Article(
+            article_source=source,
+            article_name=title,
+            article_link=f"{SOURCE_DOMAINS[source]}{title.lower().replace(' ', '-')[:60]}-{self.sequence}",
+            publish_date=self.now - timedelta(seconds=self.random.randint(0, 3 * 365 * 86400)),
+            article_content=self._text(size),
+        )
+
+
+def summarize(name: str, latencies: List[float], total_seconds: float, items: int) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    result = {
+        'operation': name,
+        'calls': len(latencies),
+        'items': items,
+        'total_seconds': round(total_seconds, 4),
+        'throughput_items_per_second': round(items / total_seconds, 2) if total_seconds else None,
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 3),
+        'p50_ms': round(latencies[len(latencies) // 2] * 1000, 3),
+        'p99_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3),
+    }
+    print(
+        f"{name:<22} calls={result['calls']:<6} items/s={result['throughput_items_per_second']!s:<10} "
+        f"p50={result['p50_ms']}ms p99={result['p99_ms']}ms"
+    )
+    return result
+
+
+async def measure(
+    name: str,
+    calls: List[Callable[[], Awaitable[Any]]],
+    items_per_call: int = 1,
+    items: int = None
+) -> Dict[str, Any]:
+    """
+    Await each call in turn. A call's arguments are built when it is invoked,
+    before the clock starts, so input generation is not part of the timings.
+    """
+    latencies = []
+    for call in calls:
+        awaitable = call()
+        call_started = time.perf_counter()
+        await awaitable
+        latencies.append(time.perf_counter() - call_started)
+    return summarize(name, latencies, sum(latencies), items or len(calls) * items_per_call)
+
+
+async def run_benchmark(articles: int, batch_size: int, samples: int, seed: int) -> List[Dict[str, Any]]:
+    article_crud = ArticleCRUD()
+    await article_crud.ensure_indexes()
+    factory = ArticleFactory(seed)
+    picker = random.Random(seed + 1)
+    results = []
+
+    # Single inserts
+    results.append(await measure(
+        'create',
+        [lambda: article_crud.create(factory.article()) for _ in range(samples)]
+    ))
+
+    # Bulk load the rest of the corpus, generating one batch at a time
+    remaining = max(0, articles - samples)
+    if remaining:
+        results.append(await measure(
+            'bulk_create',
+            [
+                lambda size=min(batch_size, remaining - offset): article_crud.bulk_create(
+                    [factory.article() for _ in range(size)]
+                )
+                for offset in range(0, remaining, batch_size)
+            ],
+            items=remaining
+        ))
+
+    total = await article_crud.count()
+    sample_docs = await article_crud._collection.aggregate([
+        {"$sample": {"size": samples}},
+        {"$project": {"article_link": 1, "article_source": 1}},
+    ]).to_list(length=samples)
+
+    results.append(await measure(
+        'find_duplicates',
+        [
+            lambda doc=doc: article_crud.find_duplicates(Article.model_construct(article_link=doc['article_link']))
+            for doc in sample_docs
+        ]
+    ))
+
+    results.append(await measure(
+        'get_by_source',
+        [lambda: article_crud.get_by_source(picker.choice(list(NewsSource)), limit=20) for _ in range(samples)],
+        items_per_call=20
+    ))
+
+    for depth in (0.1, 0.5, 0.9):
+        skip = int(total * depth)
+        results.append(await measure(
+            f'get_many_skip_{int(depth * 100)}pct',
+            [lambda skip=skip: article_crud.get_many(skip=skip, limit=100, sort_by=[("publish_date", -1)])
+             for _ in range(max(1, samples // 20))],
+            items_per_call=100
+        ))
+
+    results.append(await measure('count_all', [lambda: article_crud.count() for _ in range(max(1, samples // 10))]))
+    results.append(await measure(
+        'count_by_source',
+        [lambda: article_crud.count({"article_source": picker.choice(list(NewsSource)).value}) for _ in range(samples)]
+    ))
+
+    results.append(await measure(
+        'update',
+        [lambda doc=doc: article_crud.update(doc['_id'], {"metadata.benchmark": True}) for doc in sample_docs]
+    ))
+
+    return results
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the database layer with synthetic articles.")
+    arg_parser.add_argument("--articles", type=int, default=100_000)
+    arg_parser.add_argument("--batch-size", type=int, default=1000)
+    arg_parser.add_argument("--samples", type=int, default=500, help="Calls per latency-measured operation.")
+    arg_parser.add_argument("--seed", type=int, default=42)
+    arg_parser.add_argument("--mongodb-url", default="mongodb://localhost:27017")
+    arg_parser.add_argument("--db", default="article_scraper_bench")
+    arg_parser.add_argument("--output", default="bench_results.json")
+    arg_parser.add_argument("--keep", action="store_true", help="Do not drop the benchmark database first.")
+    args = arg_parser.parse_args()
+
+    async with DatabaseConfig.lifespan(args.mongodb_url, args.db) as db:
+        if not args.keep:
+            await db.client.drop_database(args.db)
+        server = await db.command("buildInfo")
+        results = await run_benchmark(args.articles, args.batch_size, args.samples, args.seed)
+
+    report = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'articles': args.articles,
+        'batch_size': args.batch_size,
+        'samples': args.samples,
+        'seed': args.seed,
+        'mongodb_version': server.get('version'),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
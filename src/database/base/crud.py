@@ -1,10 +1,11 @@
-from typing import Generic, TypeVar, Optional, List, Any, Dict
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from typing import Generic, TypeVar, Optional, List, Any, Dict, AsyncIterator
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 from bson import ObjectId
 from datetime import datetime
 from pydantic import BaseModel
 
 from ..config import DatabaseConfig
+from .write_buffer import WriteBehindBuffer
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
@@ -13,26 +14,45 @@ class BaseCRUD(Generic[ModelType]):
     Base class for CRUD operations.
     Implements common database operations that can be inherited by specific model CRUDs.
     """
-    # Class-level database reference
-    _db: Optional[AsyncIOMotorDatabase] = None
-
     def __init__(self, model: type[ModelType], collection_name: str):
         self.model = model
         self.collection_name = collection_name
-        
-        # Initialize database connection if not already initialized
-        if BaseCRUD._db is None:
-            BaseCRUD._db = DatabaseConfig.get_database()
-            
-        self._collection = BaseCRUD._db[collection_name]
+        self._db: Optional[AsyncIOMotorDatabase] = None
+        self._collection_handle: Optional[AsyncIOMotorCollection] = None
 
-    async def create(self, document: ModelType) -> ModelType:
-        """Create a new document in the collection."""
+    @property
+    def _collection(self) -> AsyncIOMotorCollection:
+        """
+        Collection handle resolved through DatabaseConfig on every access, so a
+        CRUD instance never holds on to a client that has been closed or that
+        belongs to another event loop.
+        """
+        db = DatabaseConfig.get_database()
+        if db is not self._db:
+            self._db = db
+            self._collection_handle = db[self.collection_name]
+        return self._collection_handle
+
+    def _prepare_document(self, document: ModelType) -> Dict[str, Any]:
+        """Convert a model into the dict that gets inserted, stamping timestamps."""
         doc_dict = document.model_dump(by_alias=True, exclude_none=True)
         doc_dict["created_at"] = datetime.utcnow()
         doc_dict["updated_at"] = doc_dict["created_at"]
-        
+        return doc_dict
+
+    def write_buffer(self, max_operations: int = 500, flush_interval_ms: int = 250) -> WriteBehindBuffer[ModelType]:
+        """Return a write-behind buffer that batches creates/updates into bulk writes."""
+        return WriteBehindBuffer(self, max_operations=max_operations, flush_interval_ms=flush_interval_ms)
+
+    async def _on_inserted(self, documents: List[Dict[str, Any]]) -> None:
+        """Hook called with documents after they were inserted; subclasses maintain derived data here."""
+
+    async def create(self, document: ModelType) -> ModelType:
+        """Create a new document in the collection."""
+        doc_dict = self._prepare_document(document)
+
         result = await self._collection.insert_one(doc_dict)
+        await self._on_inserted([doc_dict])
         return await self.get_by_id(result.inserted_id)
 
     async def get_by_id(self, id: str | ObjectId) -> Optional[ModelType]:
@@ -60,6 +80,21 @@ class BaseCRUD(Generic[ModelType]):
         documents = await cursor.to_list(length=limit)
         return [self.model.model_validate(doc) for doc in documents]
 
+    async def iter_documents(
+        self,
+        filter_query: Dict[str, Any] = None,
+        projection: Dict[str, Any] = None,
+        batch_size: int = 1000,
+        sort_by: List[tuple] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream raw documents with a server-side cursor; memory use is bounded by batch_size."""
+        cursor = self._collection.find(filter_query or {}, projection).batch_size(batch_size)
+        if sort_by:
+            cursor = cursor.sort(sort_by)
+
+        async for document in cursor:
+            yield document
+
     async def update(
         self,
         id: str | ObjectId,
@@ -104,16 +139,10 @@ class BaseCRUD(Generic[ModelType]):
         if not documents:
             return []
             
-        docs_dict = [
-            {
-                **doc.model_dump(by_alias=True, exclude_none=True),
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-            for doc in documents
-        ]
+        docs_dict = [self._prepare_document(doc) for doc in documents]
         
         result = await self._collection.insert_many(docs_dict)
+        await self._on_inserted(docs_dict)
         return await self.get_many({"_id": {"$in": result.inserted_ids}})
 
     async def bulk_update(
@@ -0,0 +1,165 @@
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from bson import ObjectId
+from pydantic import BaseModel
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, WriteError
+
+from ..exceptions import WriteBufferClosedError
+
+if TYPE_CHECKING:
+    from .crud import BaseCRUD
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+class WriteBehindBuffer(Generic[ModelType]):
+    """
+    Write-behind buffer that batches `create`/`update` calls of a CRUD into a
+    single `bulk_write`.
+
+    The buffer is flushed when it holds `max_operations` operations or when the
+    oldest pending operation is `flush_interval_ms` old, whichever comes first.
+    Every submitted operation returns a future that resolves to the document id
+    once its batch has been written (or raises the per-item write error).
+
+    Use it as an async context manager so pending operations are always flushed:
+
+        async with article_crud.write_buffer() as buffer:
+            future = await buffer.create(article)
+        inserted_id = await future
+    """
+
+    def __init__(
+        self,
+        crud: "BaseCRUD[ModelType]",
+        max_operations: int = 500,
+        flush_interval_ms: int = 250,
+        ordered: bool = False
+    ):
+        if max_operations < 1:
+            raise ValueError("max_operations must be at least 1")
+        self.crud = crud
+        self.max_operations = max_operations
+        self.flush_interval = flush_interval_ms / 1000
+        self.ordered = ordered
+
+        # (operation, document id, inserted document or None, future)
+        self._pending: List[Tuple[Any, ObjectId, Optional[Dict[str, Any]], asyncio.Future]] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._background: set = set()
+        self._closed = False
+
+    async def __aenter__(self) -> "WriteBehindBuffer[ModelType]":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def create(self, document: ModelType) -> "asyncio.Future[ObjectId]":
+        """Queue an insert; the returned future resolves to the inserted id."""
+        doc_dict = self.crud._prepare_document(document)
+        doc_dict.setdefault("_id", ObjectId())
+        return await self._submit(InsertOne(doc_dict), doc_dict["_id"], doc_dict)
+
+    async def update(
+        self,
+        id: str | ObjectId,
+        update_data: Dict[str, Any],
+        upsert: bool = False
+    ) -> "asyncio.Future[ObjectId]":
+        """Queue an update by id; the returned future resolves to the document id."""
+        if isinstance(id, str):
+            id = ObjectId(id)
+
+        update_data = {**update_data, "updated_at": datetime.utcnow()}
+        return await self._submit(UpdateOne({"_id": id}, {"$set": update_data}, upsert=upsert), id)
+
+    async def _submit(self, operation: Any, document_id: ObjectId, document: Optional[Dict[str, Any]] = None) -> asyncio.Future:
+        if self._closed:
+            raise WriteBufferClosedError(f"Write buffer for '{self.crud.collection_name}' is closed")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((operation, document_id, document, future))
+
+        if len(self._pending) >= self.max_operations:
+            # Back-pressure: the caller that fills the buffer waits for the flush
+            await self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_interval, self._flush_in_background)
+
+        return future
+
+    def _flush_in_background(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        self._background.add(task)
+        task.add_done_callback(self._on_background_flush_done)
+
+    def _on_background_flush_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # The error has already been delivered to every future of the batch
+            print(f"❌ Background flush failed for '{self.crud.collection_name}': {task.exception()}")
+
+    async def flush(self) -> int:
+        """Write every pending operation; returns the number of operations sent."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            operations = [operation for operation, _, _, _ in batch]
+            failed: Dict[int, Exception] = {}
+            try:
+                await self.crud._collection.bulk_write(operations, ordered=self.ordered)
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                for error in write_errors:
+                    failed[error["index"]] = WriteError(error.get("errmsg"), error.get("code"), error)
+                if self.ordered and write_errors:
+                    # An ordered bulk write stops at the first error; later operations were not applied
+                    first = min(failed)
+                    for index in range(first + 1, len(batch)):
+                        failed.setdefault(index, e)
+            except Exception as e:
+                for _, _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                raise
+
+            inserted = []
+            for index, (_, document_id, document, future) in enumerate(batch):
+                if index not in failed and document is not None:
+                    inserted.append(document)
+                if future.done():
+                    continue
+                if index in failed:
+                    future.set_exception(failed[index])
+                else:
+                    future.set_result(document_id)
+
+            if inserted:
+                await self.crud._on_inserted(inserted)
+
+            if failed:
+                print(f"⚠️ {len(failed)} of {len(batch)} buffered writes failed in '{self.crud.collection_name}'")
+            return len(batch)
+
+    async def close(self) -> None:
+        """Flush pending operations and refuse new ones."""
+        self._closed = True
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        await self.flush()
@@ -1,11 +1,152 @@
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from typing import Optional
+from pymongo import ReadPreference, WriteConcern
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
+from contextlib import asynccontextmanager
+from datetime import timezone
+import asyncio
 import os
+import weakref
 from dotenv import load_dotenv
 
+_READ_PREFERENCES = {
+    'primary': ReadPreference.PRIMARY,
+    'primarypreferred': ReadPreference.PRIMARY_PREFERRED,
+    'secondary': ReadPreference.SECONDARY,
+    'secondarypreferred': ReadPreference.SECONDARY_PREFERRED,
+    'nearest': ReadPreference.NEAREST,
+}
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    if value is None or value.strip() == '':
+        return default
+    return int(value)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value.strip() == '':
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
 class DatabaseConfig:
+    """
+    Process-wide MongoDB client holder.
+
+    Pool and driver options are read from the environment (or `.env`):
+
+        MONGODB_MAX_POOL_SIZE                 (default 50)
+        MONGODB_MIN_POOL_SIZE                 (default 0)
+        MONGODB_MAX_IDLE_TIME_MS              (default 300000)
+        MONGODB_CONNECT_TIMEOUT_MS            (default 10000)
+        MONGODB_SOCKET_TIMEOUT_MS             (default: driver default)
+        MONGODB_SERVER_SELECTION_TIMEOUT_MS   (default 10000)
+        MONGODB_WAIT_QUEUE_TIMEOUT_MS         (default: driver default)
+        MONGODB_COMPRESSORS                   (comma separated, e.g. "zstd,snappy,zlib")
+        MONGODB_READ_PREFERENCE               (primary, primaryPreferred, secondary, ...)
+        MONGODB_WRITE_CONCERN_W               (integer or "majority")
+        MONGODB_WRITE_CONCERN_J               (true/false)
+        MONGODB_WRITE_CONCERN_WTIMEOUT_MS
+        MONGODB_RETRY_WRITES                  (default true)
+    """
     _client: Optional[AsyncIOMotorClient] = None
     _database: Optional[AsyncIOMotorDatabase] = None
+    # Motor clients are bound to the event loop they were first used on, so each
+    # running loop gets its own client. Clients of loops that ended without
+    # close() are closed the next time a client is created.
+    _loop_clients: Dict[asyncio.AbstractEventLoop, Tuple[AsyncIOMotorClient, AsyncIOMotorDatabase]] = {}
+    _unbound: bool = False
+    _settings: Optional[Tuple[str, str]] = None
+    _loop_users: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def client_options() -> Dict[str, Any]:
+        """Build AsyncIOMotorClient keyword arguments from the environment."""
+        options: Dict[str, Any] = {
+            'maxPoolSize': _env_int('MONGODB_MAX_POOL_SIZE', 50),
+            'minPoolSize': _env_int('MONGODB_MIN_POOL_SIZE', 0),
+            'maxIdleTimeMS': _env_int('MONGODB_MAX_IDLE_TIME_MS', 300000),
+            'connectTimeoutMS': _env_int('MONGODB_CONNECT_TIMEOUT_MS', 10000),
+            'serverSelectionTimeoutMS': _env_int('MONGODB_SERVER_SELECTION_TIMEOUT_MS', 10000),
+            'retryWrites': _env_bool('MONGODB_RETRY_WRITES', True),
+            # Decode BSON dates as timezone-aware UTC datetimes
+            'tz_aware': True,
+            'tzinfo': timezone.utc,
+        }
+
+        socket_timeout = _env_int('MONGODB_SOCKET_TIMEOUT_MS', None)
+        if socket_timeout is not None:
+            options['socketTimeoutMS'] = socket_timeout
+
+        wait_queue_timeout = _env_int('MONGODB_WAIT_QUEUE_TIMEOUT_MS', None)
+        if wait_queue_timeout is not None:
+            options['waitQueueTimeoutMS'] = wait_queue_timeout
+
+        compressors = os.getenv('MONGODB_COMPRESSORS', '').strip()
+        if compressors:
+            options['compressors'] = compressors
+
+        return options
+
+    @staticmethod
+    def database_options() -> Dict[str, Any]:
+        """Build read preference / write concern options for the database handle."""
+        options: Dict[str, Any] = {}
+
+        read_preference = os.getenv('MONGODB_READ_PREFERENCE', '').strip().lower()
+        if read_preference:
+            if read_preference not in _READ_PREFERENCES:
+                raise ValueError(f"Unknown MONGODB_READ_PREFERENCE: {read_preference}")
+            options['read_preference'] = _READ_PREFERENCES[read_preference]
+
+        w = os.getenv('MONGODB_WRITE_CONCERN_W', '').strip()
+        j = os.getenv('MONGODB_WRITE_CONCERN_J', '').strip()
+        wtimeout = _env_int('MONGODB_WRITE_CONCERN_WTIMEOUT_MS', None)
+        if w or j or wtimeout is not None:
+            write_concern: Dict[str, Any] = {}
+            if w:
+                write_concern['w'] = int(w) if w.isdigit() else w
+            if j:
+                write_concern['j'] = _env_bool('MONGODB_WRITE_CONCERN_J', False)
+            if wtimeout is not None:
+                write_concern['wtimeout'] = wtimeout
+            options['write_concern'] = WriteConcern(**write_concern)
+
+        return options
+
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    @classmethod
+    def _connect(cls) -> Tuple[AsyncIOMotorClient, AsyncIOMotorDatabase]:
+        mongodb_url, db_name = cls._settings
+        try:
+            client = AsyncIOMotorClient(mongodb_url, **cls.client_options())
+            database = client.get_database(db_name, **cls.database_options())
+            print(f"✅ Connected to MongoDB: {db_name}")
+            return client, database
+        except Exception as e:
+            print(f"❌ Error connecting to MongoDB: {e}")
+            raise
+
+    @classmethod
+    def _close_stale_clients(cls) -> None:
+        """Close the clients of event loops that are closed (e.g. a finished asyncio.run)."""
+        stale = [loop for loop in cls._loop_clients if loop.is_closed()]
+        for loop in stale:
+            client, _ = cls._loop_clients.pop(loop)
+            if client is cls._client:
+                cls._client = None
+                cls._database = None
+            client.close()
+        if stale:
+            print(f"🔌 Closed {len(stale)} MongoDB connection(s) of finished event loops")
 
     @classmethod
     def initialize(cls, mongodb_url: Optional[str] = None, db_name: Optional[str] = None) -> None:
@@ -13,25 +154,86 @@ class DatabaseConfig:
         mongodb_url = mongodb_url or os.getenv('MONGODB_URL', 'mongodb://localhost:27017')
         db_name = db_name or os.getenv('MONGODB_DB', 'article_scraper')
 
-        if cls._client is None:
-            try:
-                cls._client = AsyncIOMotorClient(mongodb_url)
-                cls._database = cls._client[db_name]
-                print(f"✅ Connected to MongoDB: {db_name}")
-            except Exception as e:
-                print(f"❌ Error connecting to MongoDB: {e}")
-                raise
+        if cls._settings is None or (cls._client is None and not cls._loop_clients):
+            cls._settings = (mongodb_url, db_name)
+
+        loop = cls._running_loop()
+        if loop is None:
+            cls._close_stale_clients()
+            if cls._client is None:
+                cls._client, cls._database = cls._connect()
+                cls._unbound = True
+        elif loop not in cls._loop_clients:
+            if cls._client is not None and cls._unbound:
+                # A client created outside any loop binds to the first loop that uses it
+                cls._loop_clients[loop] = (cls._client, cls._database)
+                cls._unbound = False
+            else:
+                cls._close_stale_clients()
+                cls._loop_clients[loop] = cls._connect()
+                cls._client, cls._database = cls._loop_clients[loop]
 
     @classmethod
     def get_database(cls) -> AsyncIOMotorDatabase:
-        if cls._database is None:
+        loop = cls._running_loop()
+        if loop is None:
+            if cls._database is None:
+                cls.initialize()
+            return cls._database
+
+        if loop not in cls._loop_clients:
             cls.initialize()
-        return cls._database
+        return cls._loop_clients[loop][1]
+
+    @classmethod
+    def get_client(cls) -> AsyncIOMotorClient:
+        cls.get_database()
+        loop = cls._running_loop()
+        return cls._loop_clients[loop][0] if loop is not None else cls._client
 
     @classmethod
     def close(cls) -> None:
-        if cls._client:
-            cls._client.close()
+        """Close the client of the running loop (or every client when called outside a loop)."""
+        loop = cls._running_loop()
+        if loop is not None:
+            entry = cls._loop_clients.pop(loop, None)
+            clients = [entry[0]] if entry else []
+        else:
+            clients = [client for client, _ in cls._loop_clients.values()]
+            cls._loop_clients.clear()
+            if cls._client is not None and not any(client is cls._client for client in clients):
+                clients.append(cls._client)
+
+        if cls._client is not None and any(client is cls._client for client in clients):
             cls._client = None
             cls._database = None
+            cls._unbound = False
+
+        for client in clients:
+            client.close()
+        if clients:
             print("🔌 MongoDB connection closed")
+
+    @classmethod
+    @asynccontextmanager
+    async def lifespan(
+        cls,
+        mongodb_url: Optional[str] = None,
+        db_name: Optional[str] = None
+    ) -> AsyncIterator[AsyncIOMotorDatabase]:
+        """
+        Async context manager owning the client lifecycle.
+
+        Nested or repeated uses on the same loop share one client; its connection
+        pool is closed when the outermost context exits.
+        """
+        loop = asyncio.get_running_loop()
+        cls.initialize(mongodb_url, db_name)
+        cls._loop_users[loop] = cls._loop_users.get(loop, 0) + 1
+        try:
+            yield cls.get_database()
+        finally:
+            cls._loop_users[loop] -= 1
+            if cls._loop_users[loop] == 0:
+                del cls._loop_users[loop]
+                cls.close()
@@ -1,35 +1,270 @@
-from typing import List, Optional
-from datetime import datetime
+import zlib
+from typing import Any, Dict, List, Optional, Set
+from datetime import datetime, timedelta, timezone
+from bson import Binary, ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReplaceOne, UpdateOne
+from pymongo.errors import OperationFailure
 
 from ..base.crud import BaseCRUD
+from .source_stats_crud import SourceStatsCRUD
 from src.models.article import Article
-from src.models.enums import NewsSource
+from src.models.enums import NewsSource, ContentTier
 
 class ArticleCRUD(BaseCRUD[Article]):
     """CRUD operations for Article model."""
-    
+
+    INDEXES = [
+        IndexModel([("publish_date", DESCENDING)], name="publish_date_desc"),
+        IndexModel([("article_source", ASCENDING), ("publish_date", DESCENDING)], name="source_publish_date"),
+        # Unique, so concurrent scrapers cannot insert the same link twice
+        IndexModel([("article_link", ASCENDING)], name="article_link", unique=True),
+        IndexModel([("content_tier", ASCENDING), ("created_at", ASCENDING)], name="content_tier_created_at"),
+    ]
+
     def __init__(self):
         super().__init__(Article, "articles")
+        self.stats = SourceStatsCRUD(self.collection_name)
+        self.cold_collection_name = f"{self.collection_name}_cold"
+
+    @property
+    def _cold_collection(self) -> AsyncIOMotorCollection:
+        """Compressed bodies of tiered articles, keyed by the article _id."""
+        return self._collection.database[self.cold_collection_name]
+
+    async def ensure_indexes(self) -> List[str]:
+        """Create the indexes backing source, recency and duplicate lookups."""
+        await self.stats.ensure_indexes()
+
+        # Older deployments have a non-unique "article_link" index; an index
+        # with the same name but other options cannot be created over it.
+        link_index = (await self._collection.index_information()).get("article_link")
+        if link_index is not None and not link_index.get("unique"):
+            await self._collection.drop_index("article_link")
+
+        try:
+            return await self._collection.create_indexes(self.INDEXES)
+        except OperationFailure as e:
+            if e.code != 11000:
+                raise
+            # Existing duplicate links prevent the unique index; keep lookups fast meanwhile
+            print(f"⚠️ Duplicate article links exist, article_link index is not unique: {e}")
+            fallback = IndexModel([("article_link", ASCENDING)], name="article_link")
+            return await self._collection.create_indexes([
+                fallback if index.document["name"] == "article_link" else index for index in self.INDEXES
+            ])
+
+    async def _on_inserted(self, documents: List[Dict[str, Any]]) -> None:
+        # Keep per-source daily counters in step with ingestion
+        try:
+            await self.stats.record(documents)
+        except Exception as e:
+            print(f"❌ Error updating source stats: {e}")
+
+    async def get_by_id(self, id: str | ObjectId, with_content: bool = True) -> Optional[Article]:
+        """Retrieve an article by its ID, loading a cold body unless with_content is False."""
+        article = await super().get_by_id(id)
+        if article and with_content:
+            await self.load_contents([article])
+        return article
+
+    async def get_many(
+        self,
+        filter_query: Dict[str, Any] = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: List[tuple] = None,
+        with_content: bool = True
+    ) -> List[Article]:
+        """
+        Retrieve articles; cold bodies are fetched in one extra query. With
+        with_content=False cold articles come back as stubs and can be
+        completed later with load_content().
+        """
+        articles = await super().get_many(filter_query, skip, limit, sort_by)
+        if with_content:
+            await self.load_contents(articles)
+        return articles
+
+    async def load_content(self, article: Article) -> Article:
+        """Load the body of a cold article in place (no-op for hot articles)."""
+        await self.load_contents([article])
+        return article
+
+    async def load_contents(self, articles: List[Article]) -> None:
+        bodies = await self._cold_bodies(
+            [article.id for article in articles if article.content_tier == ContentTier.COLD.value]
+        )
+        for article in articles:
+            if article.id in bodies:
+                article.article_content = bodies[article.id]
+
+    async def load_document_contents(self, documents: List[Dict[str, Any]]) -> None:
+        """Like load_contents() for raw documents, e.g. batches from iter_documents()."""
+        bodies = await self._cold_bodies(
+            [doc["_id"] for doc in documents if doc.get("content_tier") == ContentTier.COLD.value]
+        )
+        for doc in documents:
+            if doc["_id"] in bodies:
+                doc["article_content"] = bodies[doc["_id"]]
 
-    async def get_by_source(self, source: NewsSource, limit: int = 10) -> List[Article]:
+    async def _cold_bodies(self, ids: List[ObjectId]) -> Dict[ObjectId, str]:
+        bodies = {}
+        if not ids:
+            return bodies
+        async for doc in self._cold_collection.find({"_id": {"$in": ids}}):
+            bodies[doc["_id"]] = zlib.decompress(doc["body"]).decode("utf-8")
+        return bodies
+
+    async def update(
+        self,
+        id: str | ObjectId,
+        update_data: Dict[str, Any],
+        upsert: bool = False,
+        with_content: bool = True
+    ) -> Optional[Article]:
+        """
+        Update an article by its ID. A new article_content makes the article hot
+        again and drops its cold copy; otherwise a cold body is loaded unless
+        with_content is False.
+        """
+        if isinstance(id, str):
+            id = ObjectId(id)
+
+        if "article_content" in update_data:
+            update_data["content_tier"] = ContentTier.HOT.value
+        article = await super().update(id, update_data, upsert)
+
+        if "article_content" in update_data:
+            await self._collection.update_one({"_id": id}, {"$unset": {"metadata.content_bytes": ""}})
+            await self._cold_collection.delete_one({"_id": id})
+        elif article and with_content:
+            await self.load_contents([article])
+        return article
+
+    async def move_to_cold_tier(self, older_than: datetime, batch_size: int = 500) -> int:
+        """
+        Move bodies of articles created before `older_than`, or soft-deleted,
+        into the compressed cold collection and leave a stub in the hot one.
+        The cold copy is written before the stub, so an interrupted run loses nothing.
+        """
+        cursor = self._collection.find(
+            {
+                "content_tier": {"$ne": ContentTier.COLD.value},
+                "$or": [{"created_at": {"$lt": older_than}}, {"is_active": False}],
+            },
+            {"article_content": 1}
+        ).batch_size(batch_size)
+
+        moved = 0
+        batch = []
+        async for doc in cursor:
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                moved += await self._tier_batch(batch)
+                batch = []
+        if batch:
+            moved += await self._tier_batch(batch)
+        return moved
+
+    async def _tier_batch(self, documents: List[Dict[str, Any]]) -> int:
+        now = datetime.utcnow()
+        cold_operations = []
+        hot_operations = []
+        for doc in documents:
+            content = (doc.get("article_content") or "").encode("utf-8")
+            cold_operations.append(ReplaceOne(
+                {"_id": doc["_id"]},
+                {"_id": doc["_id"], "body": Binary(zlib.compress(content, 6)), "content_bytes": len(content), "tiered_at": now},
+                upsert=True
+            ))
+            hot_operations.append(UpdateOne(
+                {"_id": doc["_id"], "content_tier": {"$ne": ContentTier.COLD.value}},
+                {"$set": {
+                    "article_content": "",
+                    "content_tier": ContentTier.COLD.value,
+                    "metadata.content_bytes": len(content),
+                }}
+            ))
+
+        await self._cold_collection.bulk_write(cold_operations, ordered=False)
+        result = await self._collection.bulk_write(hot_operations, ordered=False)
+        return result.modified_count
+
+    async def get_by_source(self, source: NewsSource, limit: int = 10, with_content: bool = True) -> List[Article]:
         """Get articles by news source."""
         return await self.get_many(
             filter_query={"article_source": source.value},
             limit=limit,
-            sort_by=[("publish_date", -1)]
+            sort_by=[("publish_date", -1)],
+            with_content=with_content
         )
 
-    async def get_recent_articles(self, days: int = 7, limit: int = 50) -> List[Article]:
+    async def get_recent_articles(self, days: int = 7, limit: int = 50, with_content: bool = True) -> List[Article]:
         """Get articles published in the last N days."""
-        date_threshold = datetime.utcnow() - datetime.timedelta(days=days)
+        date_threshold = datetime.now(timezone.utc) - timedelta(days=days)
         return await self.get_many(
             filter_query={"publish_date": {"$gte": date_threshold}},
             limit=limit,
-            sort_by=[("publish_date", -1)]
+            sort_by=[("publish_date", -1)],
+            with_content=with_content
         )
 
     async def find_duplicates(self, article: Article) -> Optional[Article]:
         # Convert article.article_link to a plain string
         filter_query = {"article_link": str(article.article_link)}
-        results = await self.get_many(filter_query=filter_query, limit=1)
+        results = await self.get_many(filter_query=filter_query, limit=1, with_content=False)
         return results[0] if results else None
+
+    async def existing_links(self, links: List[str]) -> Set[str]:
+        """The subset of `links` already stored, in one query."""
+        if not links:
+            return set()
+        cursor = self._collection.find({"article_link": {"$in": list(links)}}, {"article_link": 1, "_id": 0})
+        return {doc["article_link"] async for doc in cursor}
+
+    async def update_content_by_link(self, articles: List[Dict[str, Any]]) -> int:
+        """
+        Overwrite the body of existing articles matched by link in bulk writes.
+        Cold articles stay cold: their compressed copy is replaced and the hot
+        stub only gets the new size.
+        """
+        if not articles:
+            return 0
+
+        contents = {str(article["article_link"]): article["article_content"] for article in articles}
+        cold_ids = {
+            doc["article_link"]: doc["_id"]
+            async for doc in self._collection.find(
+                {"article_link": {"$in": list(contents)}, "content_tier": ContentTier.COLD.value},
+                {"article_link": 1}
+            )
+        }
+
+        now = datetime.utcnow()
+        hot_operations = []
+        cold_operations = []
+        for link, content in contents.items():
+            if link not in cold_ids:
+                hot_operations.append(UpdateOne(
+                    {"article_link": link, "content_tier": {"$ne": ContentTier.COLD.value}},
+                    {"$set": {"article_content": content, "updated_at": now}, "$unset": {"metadata.content_bytes": ""}}
+                ))
+                continue
+
+            body = content.encode("utf-8")
+            cold_operations.append(UpdateOne(
+                {"_id": cold_ids[link]},
+                {"$set": {"body": Binary(zlib.compress(body, 6)), "content_bytes": len(body)}},
+                upsert=True
+            ))
+            hot_operations.append(UpdateOne(
+                {"_id": cold_ids[link]},
+                {"$set": {"metadata.content_bytes": len(body), "updated_at": now}}
+            ))
+
+        # Cold bodies first, as in move_to_cold_tier(), so an interrupted run leaves no stub without its body
+        if cold_operations:
+            await self._cold_collection.bulk_write(cold_operations, ordered=False)
+        result = await self._collection.bulk_write(hot_operations, ordered=False)
+        return result.modified_count
@@ -0,0 +1,144 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from bson import ObjectId
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+
+from ..base.crud import BaseCRUD
+from src.models.scrape_job import ScrapeJob
+from src.models.enums import JobKind, JobStatus, NewsSource
+
+class ScrapeJobCRUD(BaseCRUD[ScrapeJob]):
+    """
+    MongoDB-backed work queue shared by scraper workers.
+
+    Workers claim jobs with a lease; a job whose lease expires (crashed or
+    stuck worker) becomes claimable again. Completion and failure are only
+    accepted from the current lease holder, which makes them idempotent.
+    """
+
+    INDEXES = [
+        IndexModel([("dedupe_key", ASCENDING)], name="dedupe_key", unique=True),
+        IndexModel([("status", ASCENDING), ("available_at", ASCENDING)], name="status_available_at"),
+        IndexModel([("status", ASCENDING), ("lease_expires_at", ASCENDING)], name="status_lease_expires_at"),
+    ]
+
+    def __init__(self):
+        super().__init__(ScrapeJob, "scrape_jobs")
+
+    async def ensure_indexes(self) -> List[str]:
+        return await self._collection.create_indexes(self.INDEXES)
+
+    @staticmethod
+    def dedupe_key(kind: JobKind, source: NewsSource, url: Optional[str] = None) -> str:
+        return f"{kind.value}:{source.value}:{url or ''}"
+
+    async def enqueue(
+        self,
+        kind: JobKind,
+        source: NewsSource,
+        url: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        rearm: bool = False
+    ) -> bool:
+        """
+        Add a job unless one with the same kind/source/url exists. With `rearm`,
+        a finished job is put back in the queue (used for recurring listings).
+        Returns True when a job was added or re-armed.
+        """
+        key = self.dedupe_key(kind, source, url)
+        now = datetime.now(timezone.utc)
+
+        if rearm:
+            result = await self._collection.update_one(
+                {"dedupe_key": key, "status": {"$in": [JobStatus.DONE.value, JobStatus.FAILED.value]}},
+                {"$set": {
+                    "status": JobStatus.PENDING.value,
+                    "attempts": 0,
+                    "available_at": now,
+                    "last_error": None,
+                    "updated_at": now,
+                }}
+            )
+            if result.modified_count:
+                return True
+
+        job = ScrapeJob(kind=kind, source=source, url=url, dedupe_key=key, payload=payload or {}, available_at=now)
+        document = self._prepare_document(job)
+        result = await self._collection.update_one(
+            {"dedupe_key": key},
+            {"$setOnInsert": document},
+            upsert=True
+        )
+        return result.upserted_id is not None
+
+    async def claim(self, worker_id: str, lease_seconds: int = 600) -> Optional[ScrapeJob]:
+        """Lease the oldest available job (pending, or running with an expired lease)."""
+        while True:
+            now = datetime.now(timezone.utc)
+            document = await self._collection.find_one_and_update(
+                {"$or": [
+                    {"status": JobStatus.PENDING.value, "available_at": {"$lte": now}},
+                    {"status": JobStatus.RUNNING.value, "lease_expires_at": {"$lt": now}},
+                ]},
+                {
+                    "$set": {
+                        "status": JobStatus.RUNNING.value,
+                        "lease_owner": worker_id,
+                        "lease_token": str(ObjectId()),
+                        "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                        "updated_at": now,
+                    },
+                    "$inc": {"attempts": 1},
+                },
+                sort=[("available_at", ASCENDING)],
+                return_document=ReturnDocument.AFTER
+            )
+            if document is None:
+                return None
+
+            job = self.model.model_validate(document)
+            if job.attempts <= job.max_attempts:
+                return job
+
+            # Leases of this job kept expiring; stop handing it out
+            await self._finish(job, JobStatus.FAILED, last_error=job.last_error or "Lease expired too many times")
+
+    async def heartbeat(self, job: ScrapeJob, lease_seconds: int = 600) -> bool:
+        """Extend the lease; False means the lease was lost to another worker."""
+        now = datetime.now(timezone.utc)
+        result = await self._collection.update_one(
+            {"_id": job.id, "lease_token": job.lease_token, "status": JobStatus.RUNNING.value},
+            {"$set": {"lease_expires_at": now + timedelta(seconds=lease_seconds), "updated_at": now}}
+        )
+        return result.matched_count > 0
+
+    async def _finish(self, job: ScrapeJob, status: JobStatus, **fields) -> bool:
+        now = datetime.now(timezone.utc)
+        result = await self._collection.update_one(
+            {"_id": job.id, "lease_token": job.lease_token, "status": JobStatus.RUNNING.value},
+            {"$set": {"status": status.value, "lease_expires_at": None, "updated_at": now, **fields}}
+        )
+        return result.matched_count > 0
+
+    async def complete(self, job: ScrapeJob) -> bool:
+        """Mark a leased job done. Repeating the call (or a stale lease) is a no-op returning False."""
+        return await self._finish(job, JobStatus.DONE, last_error=None, resources=job.resources)
+
+    async def fail(self, job: ScrapeJob, error: str, retry_delay: float = 60.0) -> bool:
+        """Release a leased job for a later retry, or mark it failed once attempts are used up."""
+        if job.attempts >= job.max_attempts:
+            return await self._finish(job, JobStatus.FAILED, last_error=error, resources=job.resources)
+
+        delay = retry_delay * 2 ** (job.attempts - 1)
+        return await self._finish(
+            job,
+            JobStatus.PENDING,
+            last_error=error,
+            resources=job.resources,
+            available_at=datetime.now(timezone.utc) + timedelta(seconds=delay)
+        )
+
+    async def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+        return {doc["_id"]: doc["count"] async for doc in self._collection.aggregate(pipeline)}
@@ -0,0 +1,33 @@
+from typing import List, Optional
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from ..base.crud import BaseCRUD
+from src.models.article import ScrapingResult
+from src.models.scrape_run import ScrapeRun
+from src.models.enums import NewsSource
+
+class ScrapeRunCRUD(BaseCRUD[ScrapeRun]):
+    """Log of scraper runs (status, duration, resource peaks) written by main and the scheduler."""
+
+    INDEXES = [
+        IndexModel([("source", ASCENDING), ("created_at", DESCENDING)], name="source_created_at"),
+    ]
+
+    def __init__(self):
+        super().__init__(ScrapeRun, "scrape_runs")
+
+    async def ensure_indexes(self) -> List[str]:
+        return await self._collection.create_indexes(self.INDEXES)
+
+    async def record(self, source: NewsSource, result: Optional[ScrapingResult]) -> None:
+        """Store the result of a run; failures are logged, a missing report must not stop scraping."""
+        if result is None:
+            return
+        try:
+            await self.create(ScrapeRun.from_result(source, result))
+        except Exception as e:
+            print(f"❌ Error recording scraper run: {e}")
+
+    async def get_recent(self, source: NewsSource, limit: int = 20) -> List[ScrapeRun]:
+        """Latest runs of a source, newest first."""
+        return await self.get_many({"source": source.value}, limit=limit, sort_by=[("created_at", -1)])
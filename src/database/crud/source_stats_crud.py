@@ -0,0 +1,117 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+
+from ..base.crud import BaseCRUD
+from src.models.source_stats import SourceDailyStats
+from src.models.enums import NewsSource
+from src.models.article import ensure_utc
+
+class SourceStatsCRUD(BaseCRUD[SourceDailyStats]):
+    """
+    Incrementally maintained article statistics per NewsSource per day.
+
+    The ingestion path calls `record` with every inserted article document;
+    `rebuild` recomputes the whole collection from `articles` in one pipeline.
+    """
+
+    INDEXES = [
+        IndexModel([("source", ASCENDING), ("day", DESCENDING)], name="source_day", unique=True),
+    ]
+
+    def __init__(self, articles_collection: str = "articles"):
+        super().__init__(SourceDailyStats, "source_daily_stats")
+        self.articles_collection = articles_collection
+
+    async def ensure_indexes(self) -> List[str]:
+        return await self._collection.create_indexes(self.INDEXES)
+
+    @staticmethod
+    def _day(value: datetime) -> datetime:
+        value = ensure_utc(value)
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+
+    async def record(self, documents: List[Dict[str, Any]]) -> None:
+        """Add inserted article documents to their source/day counters with atomic $inc upserts."""
+        totals: Dict[tuple, Dict[str, Any]] = {}
+        for doc in documents:
+            created_at = doc.get("created_at") or datetime.now(timezone.utc)
+            key = (doc["article_source"], self._day(created_at))
+            entry = totals.setdefault(key, {"count": 0, "bytes": 0, "last_seen_at": None, "last_publish_date": None})
+            entry["count"] += 1
+            entry["bytes"] += len((doc.get("article_content") or "").encode("utf-8"))
+            entry["last_seen_at"] = max(filter(None, (entry["last_seen_at"], ensure_utc(created_at))))
+            if doc.get("publish_date"):
+                publish_date = ensure_utc(doc["publish_date"])
+                entry["last_publish_date"] = max(filter(None, (entry["last_publish_date"], publish_date)))
+
+        operations = []
+        for (source, day), entry in totals.items():
+            update: Dict[str, Any] = {
+                "$inc": {"article_count": entry["count"], "content_bytes": entry["bytes"]},
+                "$max": {"last_seen_at": entry["last_seen_at"]},
+            }
+            if entry["last_publish_date"]:
+                update["$max"]["last_publish_date"] = entry["last_publish_date"]
+            operations.append(UpdateOne({"source": source, "day": day}, update, upsert=True))
+
+        if operations:
+            await self._collection.bulk_write(operations, ordered=False)
+
+    async def get_day(self, source: NewsSource, day: datetime) -> Optional[SourceDailyStats]:
+        doc = await self._collection.find_one({"source": source.value, "day": self._day(day)})
+        return self.model.model_validate(doc) if doc else None
+
+    async def get_range(
+        self,
+        source: Optional[NewsSource] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[SourceDailyStats]:
+        """Daily rows for a source (or all sources) between two days, newest first."""
+        filter_query: Dict[str, Any] = {}
+        if source:
+            filter_query["source"] = source.value
+        if since or until:
+            filter_query["day"] = {}
+            if since:
+                filter_query["day"]["$gte"] = self._day(since)
+            if until:
+                filter_query["day"]["$lte"] = self._day(until)
+
+        cursor = self._collection.find(filter_query).sort([("source", ASCENDING), ("day", DESCENDING)])
+        return [self.model.model_validate(doc) async for doc in cursor]
+
+    async def rebuild(self) -> int:
+        """Recompute every counter from the articles collection; returns the number of rows."""
+        pipeline = [
+            {"$group": {
+                "_id": {
+                    "source": "$article_source",
+                    "day": {"$dateTrunc": {"date": "$created_at", "unit": "day"}},
+                },
+                "article_count": {"$sum": 1},
+                # Tiered articles keep their original body size in metadata
+                "content_bytes": {"$sum": {"$ifNull": [
+                    "$metadata.content_bytes",
+                    {"$strLenBytes": {"$ifNull": ["$article_content", ""]}},
+                ]}},
+                "last_seen_at": {"$max": "$created_at"},
+                "last_publish_date": {"$max": "$publish_date"},
+            }},
+            {"$project": {
+                "_id": 0,
+                "source": "$_id.source",
+                "day": "$_id.day",
+                "article_count": 1,
+                "content_bytes": 1,
+                "last_seen_at": 1,
+                "last_publish_date": 1,
+            }},
+            # $out swaps the collection atomically and keeps its indexes
+            {"$out": self.collection_name},
+        ]
+        await self.ensure_indexes()
+        db = self._collection.database
+        await db[self.articles_collection].aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+        return await self.count()
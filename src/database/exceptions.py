@@ -0,0 +1,6 @@
+class DatabaseError(Exception):
+    """Base class for database layer errors."""
+
+
+class WriteBufferClosedError(DatabaseError):
+    """Raised when an operation is submitted to a write buffer that has been closed."""
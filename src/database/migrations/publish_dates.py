@@ -0,0 +1,69 @@
+"""
+Rewrite string-typed `publish_date` values in the articles collection as
+timezone-aware BSON dates.
+
+    python -m src.database.migrations.publish_dates [--batch-size 1000] [--dry-run]
+"""
+import argparse
+import asyncio
+from typing import Dict
+
+from dateutil import parser
+from pymongo import UpdateOne
+
+from src.database.config import DatabaseConfig
+from src.database.crud.article_crud import ArticleCRUD
+from src.models.article import ensure_utc
+
+
+async def migrate_publish_dates(batch_size: int = 1000, dry_run: bool = False) -> Dict[str, int]:
+    """Convert string publish dates in batches; unparseable values are moved to metadata."""
+    article_crud = ArticleCRUD()
+    collection = article_crud._collection
+    stats = {'scanned': 0, 'converted': 0, 'unparseable': 0}
+    operations = []
+
+    cursor = collection.find(
+        {"publish_date": {"$type": "string"}},
+        {"publish_date": 1}
+    ).batch_size(batch_size)
+
+    async for doc in cursor:
+        stats['scanned'] += 1
+        raw_date = doc["publish_date"]
+        try:
+            update = {"$set": {"publish_date": ensure_utc(parser.parse(raw_date))}}
+            stats['converted'] += 1
+        except (ValueError, OverflowError):
+            update = {"$set": {"publish_date": None, "metadata.raw_publish_date": raw_date}}
+            stats['unparseable'] += 1
+
+        # Match on the old value so a concurrent writer's newer date is never overwritten
+        operations.append(UpdateOne({"_id": doc["_id"], "publish_date": raw_date}, update))
+        if len(operations) >= batch_size:
+            if not dry_run:
+                await collection.bulk_write(operations, ordered=False)
+            operations = []
+            print(f"Processed {stats['scanned']} articles...")
+
+    if operations and not dry_run:
+        await collection.bulk_write(operations, ordered=False)
+
+    if not dry_run:
+        await article_crud.ensure_indexes()
+    return stats
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description="Convert string publish_date values to BSON dates.")
+    arg_parser.add_argument("--batch-size", type=int, default=1000)
+    arg_parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing.")
+    args = arg_parser.parse_args()
+
+    async with DatabaseConfig.lifespan():
+        stats = await migrate_publish_dates(batch_size=args.batch_size, dry_run=args.dry_run)
+    print(f"✅ publish_date migration finished: {stats}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
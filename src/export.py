@@ -0,0 +1,310 @@
+"""
+Stream the articles collection to gzip-compressed JSONL or Parquet.
+
+    python -m src.export --format jsonl --output exports/articles.jsonl.gz
+    python -m src.export --format parquet --output exports/articles --since 2025-01-01 --resume
+
+Documents are read in `_id` order through a batched cursor and written as
+they arrive, so memory stays constant. With --resume, the export continues
+after the last `_id` recorded in `<output>.checkpoint.json`. The checkpoint
+only ever covers data in finished, readable files: JSONL gets one complete
+gzip member per batch, and Parquet parts are renamed into place once their
+footer is written. Bodies of cold-tier articles are read back from the
+compressed collection one batch at a time.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from dateutil import parser
+
+from src.database.config import DatabaseConfig
+from src.database.crud.article_crud import ArticleCRUD
+from src.models.article import ensure_utc
+
+DATE_FIELDS = ('publish_date', 'created_at', 'updated_at')
+
+
+def _json_default(value: Any):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return ensure_utc(value).isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class Checkpoint:
+    def __init__(self, output: str):
+        self.path = f"{output.rstrip(os.sep)}.checkpoint.json"
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save(self, last_id: ObjectId, exported: int, **writer_state: Any) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'last_id': str(last_id), 'exported': exported, **writer_state}, f)
+        os.replace(tmp_path, self.path)
+
+
+class JsonlWriter:
+    """
+    Writes every batch as one complete gzip member (gzip readers concatenate
+    members transparently), so the file is readable after each batch. On
+    resume the file is cut back to the end of the last checkpointed member,
+    dropping whatever a crash left half-written behind it.
+    """
+
+    def __init__(self, output: str, append: bool, offset: Optional[int] = None):
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        if append and offset is not None and os.path.exists(output):
+            self._file = open(output, 'r+b')
+            self._file.truncate(offset)
+            self._file.seek(offset)
+        else:
+            self._file = open(output, 'ab' if append else 'wb')
+
+    def write_batch(self, documents: List[Dict[str, Any]]) -> bool:
+        """Write a batch; always True, since every batch is readable as soon as it is written."""
+        data = "".join(json.dumps(doc, default=_json_default, ensure_ascii=False) + "\n" for doc in documents)
+        self._file.write(gzip.compress(data.encode('utf-8')))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return True
+
+    def state(self) -> Dict[str, Any]:
+        return {'offset': self._file.tell()}
+
+    def close(self) -> None:
+        self._file.close()
+
+    abort = close
+
+
+class ParquetWriter:
+    """
+    Writes one row group per batch into `<output>/part-<timestamp>-<n>.parquet`,
+    starting a new part every `part_rows` rows. Parquet files are only readable
+    once their footer is written, so a part is written under a `.tmp` name and
+    renamed when it is closed.
+    """
+
+    def __init__(
+        self,
+        output: str,
+        fields: Optional[List[str]],
+        compression: str = 'zstd',
+        part_rows: int = 100_000
+    ):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+
+        self._pa = pa
+        self._pq = pq
+        timestamp = pa.timestamp('us', tz='UTC')
+        columns = [
+            ('_id', pa.string()),
+            ('article_source', pa.string()),
+            ('article_name', pa.string()),
+            ('article_link', pa.string()),
+            ('publish_date', timestamp),
+            ('article_content', pa.string()),
+            ('created_at', timestamp),
+            ('updated_at', timestamp),
+            ('version', pa.int64()),
+            ('is_active', pa.bool_()),
+            ('metadata', pa.string()),
+        ]
+        if fields:
+            columns = [column for column in columns if column[0] in fields or column[0] == '_id']
+        self.schema = pa.schema(columns)
+
+        os.makedirs(output, exist_ok=True)
+        # Parts a crashed run never finished are not covered by the checkpoint
+        for name in os.listdir(output):
+            if name.endswith('.parquet.tmp'):
+                os.remove(os.path.join(output, name))
+
+        self.output = output
+        self.compression = compression
+        self.part_rows = part_rows
+        self._run = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+        self._parts = 0
+        self._path: Optional[str] = None
+        self._writer = None
+        self._rows = 0
+
+    def _row(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        row = {}
+        for name in self.schema.names:
+            value = document.get(name)
+            if name == '_id':
+                value = str(value)
+            elif name == 'metadata':
+                value = json.dumps(value, default=_json_default) if value is not None else None
+            elif name in DATE_FIELDS and isinstance(value, datetime):
+                value = ensure_utc(value)
+            elif name in DATE_FIELDS:
+                # Rows not yet migrated to BSON dates
+                value = ensure_utc(parser.parse(value)) if value else None
+            row[name] = value
+        return row
+
+    def write_batch(self, documents: List[Dict[str, Any]]) -> bool:
+        """Write a batch; returns True when it ended up in a finished part."""
+        if self._writer is None:
+            self._parts += 1
+            self._path = os.path.join(self.output, f"part-{self._run}-{self._parts:05d}.parquet")
+            self._writer = self._pq.ParquetWriter(f"{self._path}.tmp", self.schema, compression=self.compression)
+            self._rows = 0
+
+        table = self._pa.Table.from_pylist([self._row(doc) for doc in documents], schema=self.schema)
+        self._writer.write_table(table)
+        self._rows += len(documents)
+        if self._rows < self.part_rows:
+            return False
+        self.close()
+        return True
+
+    def state(self) -> Dict[str, Any]:
+        return {}
+
+    def close(self) -> None:
+        """Finish the current part: write its footer and move it into place."""
+        if self._writer is None:
+            return
+        self._writer.close()
+        os.replace(f"{self._path}.tmp", self._path)
+        self._writer = None
+
+    def abort(self) -> None:
+        """Drop the current part; its rows are not checkpointed and will be exported again."""
+        if self._writer is None:
+            return
+        self._writer.close()
+        os.remove(f"{self._path}.tmp")
+        self._writer = None
+
+
+def _date_arg(value: str) -> datetime:
+    return ensure_utc(parser.parse(value))
+
+
+async def export_articles(
+    output: str,
+    fmt: str = 'jsonl',
+    date_field: str = 'publish_date',
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    fields: Optional[List[str]] = None,
+    batch_size: int = 5000,
+    resume: bool = False,
+    part_rows: int = 100_000
+) -> int:
+    """Export matching articles in `_id` order; returns the number of documents written."""
+    checkpoint = Checkpoint(output)
+    state = checkpoint.load() if resume else None
+    exported = state['exported'] if state else 0
+
+    filter_query: Dict[str, Any] = {}
+    if since or until:
+        date_range = {}
+        if since:
+            date_range['$gte'] = since
+        if until:
+            date_range['$lt'] = until
+        filter_query[date_field] = date_range
+    if state:
+        filter_query['_id'] = {'$gt': ObjectId(state['last_id'])}
+
+    projection = {field: 1 for field in fields} if fields else None
+    with_content = not fields or 'article_content' in fields
+    if projection and with_content:
+        # Needed to find tiered articles whose body lives in the cold collection
+        projection['content_tier'] = 1
+    if fmt == 'jsonl':
+        writer = JsonlWriter(output, append=bool(state), offset=state.get('offset') if state else None)
+    else:
+        writer = ParquetWriter(output, fields, part_rows=part_rows)
+
+    article_crud = ArticleCRUD()
+
+    last_id = None
+    committed = True
+
+    async def write_batch(documents: List[Dict[str, Any]]) -> None:
+        nonlocal exported, last_id, committed
+        if with_content:
+            await article_crud.load_document_contents(documents)
+            if fields and 'content_tier' not in fields:
+                for doc in documents:
+                    doc.pop('content_tier', None)
+        committed = writer.write_batch(documents)
+        exported += len(documents)
+        last_id = documents[-1]['_id']
+        if committed:
+            checkpoint.save(last_id, exported, **writer.state())
+
+    batch: List[Dict[str, Any]] = []
+    try:
+        async for document in article_crud.iter_documents(filter_query, projection, batch_size, sort_by=[('_id', 1)]):
+            batch.append(document)
+            if len(batch) >= batch_size:
+                await write_batch(batch)
+                print(f"Exported {exported} articles...")
+                batch = []
+
+        if batch:
+            await write_batch(batch)
+    except BaseException:
+        writer.abort()
+        raise
+
+    writer.close()
+    if not committed:
+        checkpoint.save(last_id, exported, **writer.state())
+    return exported
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description="Export the articles collection.")
+    arg_parser.add_argument("--output", required=True, help="JSONL .gz file or Parquet directory.")
+    arg_parser.add_argument("--format", choices=('jsonl', 'parquet'), default='jsonl')
+    arg_parser.add_argument("--date-field", choices=('publish_date', 'created_at'), default='publish_date')
+    arg_parser.add_argument("--since", type=_date_arg, help="Inclusive lower bound on --date-field.")
+    arg_parser.add_argument("--until", type=_date_arg, help="Exclusive upper bound on --date-field.")
+    arg_parser.add_argument("--fields", help="Comma separated fields to export (default: all).")
+    arg_parser.add_argument("--batch-size", type=int, default=5000)
+    arg_parser.add_argument("--resume", action="store_true", help="Continue after the last exported _id.")
+    arg_parser.add_argument("--part-rows", type=int, default=100_000, help="Rows per Parquet part file.")
+    args = arg_parser.parse_args()
+
+    fields = [field.strip() for field in args.fields.split(',')] if args.fields else None
+    async with DatabaseConfig.lifespan():
+        exported = await export_articles(
+            args.output,
+            fmt=args.format,
+            date_field=args.date_field,
+            since=args.since,
+            until=args.until,
+            fields=fields,
+            batch_size=args.batch_size,
+            resume=args.resume,
+            part_rows=args.part_rows,
+        )
+    print(f"✅ Exported {exported} articles to {args.output}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -1,9 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Annotated
-from pydantic import BaseModel, HttpUrl, Field, ConfigDict, GetJsonSchemaHandler, BeforeValidator
+from pydantic import BaseModel, HttpUrl, Field, ConfigDict, GetJsonSchemaHandler, BeforeValidator, AfterValidator
 from pydantic.json_schema import JsonSchemaValue
 from bson import ObjectId
-from .enums import NewsSource, ScraperStatus
+from .enums import NewsSource, ScraperStatus, ContentTier
 import json
 
 def validate_object_id(v: Any) -> ObjectId:
@@ -15,6 +15,14 @@ def validate_object_id(v: Any) -> ObjectId:
 
 PyObjectId = Annotated[ObjectId, BeforeValidator(validate_object_id)]
 
+def ensure_utc(v: datetime) -> datetime:
+    """Normalize a datetime to timezone-aware UTC; naive values are taken as UTC."""
+    if v.tzinfo is None:
+        return v.replace(tzinfo=timezone.utc)
+    return v.astimezone(timezone.utc)
+
+UtcDatetime = Annotated[datetime, AfterValidator(ensure_utc)]
+
 class Article(BaseModel):
     """
     Article model with MongoDB support.
@@ -27,12 +35,14 @@ class Article(BaseModel):
     version: int = Field(default=1)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     is_active: bool = Field(default=True)
+    # COLD: article_content was moved to the cold collection and is empty here until loaded
+    content_tier: ContentTier = Field(default=ContentTier.HOT, validate_default=True)
 
     # Core article fields
     article_source: NewsSource
     article_name: str
     article_link: HttpUrl
-    publish_date: Optional[datetime] = None
+    publish_date: Optional[UtcDatetime] = None
     article_content: str
 
     model_config = ConfigDict(
@@ -166,6 +176,9 @@ class ScrapingResult(BaseModel):
         }
     )
     events: List[ScrapingEvent] = Field(default_factory=list)
+    # Peak RSS, child process memory, open file descriptors and, in debug mode, top allocations.
+    # Measured for the whole process, so concurrent scrapers in one process share these numbers.
+    resources: Dict[str, Any] = Field(default_factory=dict)
 
     class Config:
         json_schema_extra = {
@@ -181,6 +194,14 @@ class ScrapingResult(BaseModel):
                     "failed": 1,
                     "skipped": 1
                 },
-                "events": []
+                "events": [],
+                "resources": {
+                    "peak_rss_mb": 412.5,
+                    "max_rss_mb": 430.1,
+                    "peak_child_rss_mb": 1210.0,
+                    "peak_child_processes": 9,
+                    "peak_open_fds": 87,
+                    "fetcher_recycles": 0
+                }
             }
         }
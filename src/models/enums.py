@@ -11,4 +11,18 @@ class NewsSource(Enum):
 class ScraperStatus(Enum):
     SUCCESS = auto()
     PARTIAL = auto()
-    FAILED = auto()
\ No newline at end of file
+    FAILED = auto()
+
+class JobKind(Enum):
+    LISTING = "LISTING"
+    ARTICLE = "ARTICLE"
+
+class JobStatus(Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+class ContentTier(Enum):
+    HOT = "HOT"
+    COLD = "COLD"
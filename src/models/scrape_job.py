@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict
+from bson import ObjectId
+from .article import PyObjectId, UtcDatetime
+from .enums import NewsSource, JobKind, JobStatus
+
+class ScrapeJob(BaseModel):
+    """
+    A unit of scraping work in the shared MongoDB queue.
+    LISTING jobs discover articles of a source; ARTICLE jobs scrape one URL.
+    """
+    # MongoDB fields
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    # Job fields
+    kind: JobKind
+    source: NewsSource
+    url: Optional[str] = None
+    dedupe_key: str
+    payload: Dict[str, Any] = Field(default_factory=dict)
+
+    # Queue state
+    status: JobStatus = Field(default=JobStatus.PENDING, validate_default=True)
+    attempts: int = 0
+    max_attempts: int = 5
+    available_at: UtcDatetime = Field(default_factory=datetime.utcnow)
+    lease_owner: Optional[str] = None
+    lease_token: Optional[str] = None
+    lease_expires_at: Optional[UtcDatetime] = None
+    last_error: Optional[str] = None
+    # Resource report (peak RSS, browser memory, open files) of the latest attempt
+    resources: Dict[str, Any] = Field(default_factory=dict)
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        use_enum_values=True,
+        json_encoders={
+            ObjectId: str,
+            datetime: lambda dt: dt.isoformat()
+        }
+    )
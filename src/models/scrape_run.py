@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict
+from bson import ObjectId
+from .article import PyObjectId, ScrapingResult
+from .enums import NewsSource
+
+class ScrapeRun(BaseModel):
+    """
+    Outcome of one scraper run without its articles: status, duration, counters
+    and the resource report, kept to size the hosts that run the scrapers.
+    """
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    source: NewsSource
+    # ScraperStatus name (SUCCESS, PARTIAL, FAILED)
+    status: str
+    error_message: Optional[str] = None
+    execution_time: float = 0.0
+    stats: Dict[str, int] = Field(default_factory=dict)
+    resources: Dict[str, Any] = Field(default_factory=dict)
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        use_enum_values=True,
+        json_encoders={
+            ObjectId: str,
+            datetime: lambda dt: dt.isoformat()
+        }
+    )
+
+    @classmethod
+    def from_result(cls, source: NewsSource, result: ScrapingResult) -> "ScrapeRun":
+        return cls(
+            source=source,
+            status=result.status.name,
+            error_message=result.error_message,
+            execution_time=result.execution_time,
+            stats=result.stats,
+            resources=result.resources,
+        )
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict
+from bson import ObjectId
+from .article import PyObjectId, UtcDatetime
+from .enums import NewsSource
+
+class SourceDailyStats(BaseModel):
+    """Per-source, per-day ingestion counters (day = UTC day the articles were stored)."""
+    id: Optional[PyObjectId] = Field(default=None, alias="_id")
+    source: NewsSource
+    day: UtcDatetime
+    article_count: int = 0
+    content_bytes: int = 0
+    last_seen_at: Optional[UtcDatetime] = None
+    last_publish_date: Optional[UtcDatetime] = None
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        use_enum_values=True,
+        json_encoders={
+            ObjectId: str,
+            datetime: lambda dt: dt.isoformat()
+        }
+    )
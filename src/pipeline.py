@@ -0,0 +1,65 @@
+from typing import Any, Dict, List
+
+from pymongo.errors import WriteError
+
+from src.models.article import Article
+from src.database.crud.article_crud import ArticleCRUD
+
+
+async def store_articles(article_crud: ArticleCRUD, scraped_articles: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Validate scraped article dicts and insert the new ones through a write-behind buffer."""
+    stats = {'inserted': 0, 'duplicates': 0, 'failed': 0}
+
+    articles = []
+    for article_data in scraped_articles:
+        try:
+            # Create Article instance with the exact field names from the scraper
+            articles.append(Article(**article_data))
+        except Exception as e:
+            print(f"Error processing article: {e}")
+            stats['failed'] += 1
+
+    # Check for duplicate articles by URL, in the database (one query) and within this batch
+    try:
+        seen_links = await article_crud.existing_links([str(article.article_link) for article in articles])
+    except Exception as e:
+        # The unique article_link index still rejects duplicates at insert time
+        print(f"Error checking for duplicate articles: {e}")
+        seen_links = set()
+    new_articles = []
+    for article in articles:
+        link = str(article.article_link)
+        if link in seen_links:
+            print(f"Article already exists: {article.article_link}")
+            stats['duplicates'] += 1
+        else:
+            seen_links.add(link)
+            new_articles.append(article)
+
+    # Buffer inserts so one scraper's articles are written in a single bulk write
+    inserts = []
+    try:
+        async with article_crud.write_buffer() as buffer:
+            for article in new_articles:
+                inserts.append((article, await buffer.create(article)))
+    except Exception as e:
+        # The error is also set on the future of every buffered article; count them below
+        print(f"Error writing articles: {e}")
+        # Articles never queued because an earlier flush failed
+        stats['failed'] += len(new_articles) - len(inserts)
+
+    for article, inserted in inserts:
+        try:
+            await inserted
+            print(f"Inserted article: {article.article_link}")
+            stats['inserted'] += 1
+        except Exception as e:
+            if isinstance(e, WriteError) and e.code == 11000:
+                # Inserted by a concurrent scraper after the duplicate check
+                print(f"Article already exists: {article.article_link}")
+                stats['duplicates'] += 1
+            else:
+                print(f"Error inserting article {article.article_link}: {e}")
+                stats['failed'] += 1
+
+    return stats
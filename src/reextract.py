@@ -0,0 +1,40 @@
+"""
+Re-extract article bodies from the local HTML archive and update the
+stored articles, without any network access.
+
+    python -m src.reextract [--sources OPENAI,GROQ] [--dry-run]
+"""
+import argparse
+import asyncio
+
+from src.database.config import DatabaseConfig
+from src.database.crud.article_crud import ArticleCRUD
+from src.models.enums import NewsSource
+from src.web_scraper.parsing import shutdown_parse_pool
+from src.web_scraper.registry import SCRAPERS
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description="Re-extract article content from the HTML archive.")
+    arg_parser.add_argument("--sources", help="Comma separated NewsSource values (default: all).")
+    arg_parser.add_argument("--dry-run", action="store_true", help="Extract only, do not update the database.")
+    args = arg_parser.parse_args()
+
+    sources = [NewsSource(value.strip().upper()) for value in args.sources.split(',')] if args.sources else list(SCRAPERS)
+
+    async with DatabaseConfig.lifespan():
+        article_crud = ArticleCRUD()
+        for source in sources:
+            scraper = SCRAPERS[source]()
+            articles = await asyncio.to_thread(scraper.replay_archive)
+            if args.dry_run:
+                print(f"{source.value}: re-extracted {len(articles)} articles")
+                continue
+            updated = await article_crud.update_content_by_link(articles)
+            print(f"{source.value}: re-extracted {len(articles)} articles, updated {updated}")
+
+    shutdown_parse_pool()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""
+Long-running scheduler: keeps the MongoDB client and one warm scraper per
+source alive and runs every NewsSource on its own interval.
+
+    python -m src.scheduler [--sources OPENAI,GROQ]
+
+Intervals (seconds) come from SCRAPE_INTERVAL_<SOURCE>, falling back to
+SCRAPE_INTERVAL (default 3600). SCHEDULER_MAX_CONCURRENT caps how many
+sources scrape at the same time (default 2).
+"""
+import argparse
+import asyncio
+import os
+import signal
+import time
+from typing import Dict, Iterable, Optional
+
+from dotenv import load_dotenv
+
+from src.database.config import DatabaseConfig
+from src.database.crud.article_crud import ArticleCRUD
+from src.database.crud.scrape_run_crud import ScrapeRunCRUD
+from src.models.enums import NewsSource
+from src.pipeline import store_articles
+from src.web_scraper.parsing import shutdown_parse_pool
+from src.web_scraper.registry import SCRAPERS
+
+DEFAULT_INTERVAL = 3600
+
+
+def source_interval(source: NewsSource) -> float:
+    """Scrape interval for a source in seconds."""
+    default = float(os.getenv('SCRAPE_INTERVAL', DEFAULT_INTERVAL))
+    return float(os.getenv(f'SCRAPE_INTERVAL_{source.value}', default))
+
+
+class Scheduler:
+    """Runs each source on its own interval; a source never overlaps with itself."""
+
+    def __init__(self, sources: Optional[Iterable[NewsSource]] = None, max_concurrent: Optional[int] = None):
+        load_dotenv()
+        self.sources = list(sources or SCRAPERS.keys())
+        self.intervals: Dict[NewsSource, float] = {source: source_interval(source) for source in self.sources}
+        self.max_concurrent = max_concurrent or int(os.getenv('SCHEDULER_MAX_CONCURRENT', '2'))
+        # Scrapers are created once and reused every cycle
+        self.scrapers = {source: SCRAPERS[source]() for source in self.sources}
+        self.run_crud = ScrapeRunCRUD()
+        self._stop: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def stop(self) -> None:
+        """Ask every source loop to finish its current run and exit."""
+        if self._stop is not None and not self._stop.is_set():
+            print("\nShutting down scheduler, waiting for running scrapers to finish...")
+            self._stop.set()
+
+    async def run(self) -> None:
+        self._stop = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        async with DatabaseConfig.lifespan():
+            article_crud = ArticleCRUD()
+            await article_crud.ensure_indexes()
+            await self.run_crud.ensure_indexes()
+
+            await asyncio.gather(*(self._run_source(source, article_crud) for source in self.sources))
+        shutdown_parse_pool()
+        print("👋 Scheduler stopped")
+
+    async def _run_source(self, source: NewsSource, article_crud: ArticleCRUD) -> None:
+        interval = self.intervals[source]
+        scraper = self.scrapers[source]
+        print(f"Scheduling {source.value} every {interval:.0f}s")
+
+        while not self._stop.is_set():
+            started = time.monotonic()
+            async with self._slots:
+                if self._stop.is_set():
+                    break
+                await self._run_once(source, scraper, article_crud)
+
+            # Sleep until the next slot; a run longer than the interval starts the next one immediately
+            remaining = interval - (time.monotonic() - started)
+            if remaining > 0:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _run_once(self, source, scraper, article_crud: ArticleCRUD) -> None:
+        print(f"\nStarting scraper: {type(scraper).__name__}")
+        started = time.monotonic()
+        try:
+            scraped_articles = await asyncio.to_thread(scraper.scrape)
+            stats = await store_articles(article_crud, scraped_articles)
+            print(f"Finished {source.value} in {time.monotonic() - started:.1f}s: {stats}")
+            # Status and resource peaks of the run, kept in scrape_runs for sizing
+            await self.run_crud.record(source, scraper.last_result)
+        except Exception as e:
+            print(f"Error running scraper {source.value}: {e}")
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description="Run news scrapers on per-source intervals.")
+    arg_parser.add_argument("--sources", help="Comma separated NewsSource values (default: all).")
+    args = arg_parser.parse_args()
+
+    sources = [NewsSource(value.strip().upper()) for value in args.sources.split(',')] if args.sources else None
+    await Scheduler(sources).run()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
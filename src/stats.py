@@ -0,0 +1,38 @@
+"""
+Per-source daily article statistics.
+
+    python -m src.stats                      # print the last 7 days
+    python -m src.stats --days 30 --source OPENAI
+    python -m src.stats --rebuild            # recompute from the articles collection
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src.database.config import DatabaseConfig
+from src.database.crud.source_stats_crud import SourceStatsCRUD
+from src.models.enums import NewsSource
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description="Show or rebuild per-source daily statistics.")
+    arg_parser.add_argument("--rebuild", action="store_true", help="Recompute every counter from the articles.")
+    arg_parser.add_argument("--source", help="NewsSource value to show (default: all).")
+    arg_parser.add_argument("--days", type=int, default=7)
+    args = arg_parser.parse_args()
+
+    async with DatabaseConfig.lifespan():
+        stats_crud = SourceStatsCRUD()
+        if args.rebuild:
+            rows = await stats_crud.rebuild()
+            print(f"✅ Rebuilt {rows} source/day rows")
+            return
+
+        source = NewsSource(args.source.upper()) if args.source else None
+        since = datetime.now(timezone.utc) - timedelta(days=args.days)
+        for row in await stats_crud.get_range(source, since=since):
+            print(f"{row.source:<10} {row.day:%Y-%m-%d} articles={row.article_count:<5} bytes={row.content_bytes:<9} last_seen={row.last_seen_at}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
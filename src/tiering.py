@@ -0,0 +1,35 @@
+"""
+Move bodies of old or soft-deleted articles to the compressed cold tier.
+
+    python -m src.tiering [--days 90] [--batch-size 500]
+
+The age threshold defaults to ARTICLE_COLD_AFTER_DAYS (90).
+"""
+import argparse
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+from dotenv import load_dotenv
+
+from src.database.config import DatabaseConfig
+from src.database.crud.article_crud import ArticleCRUD
+
+
+async def main():
+    load_dotenv()
+    arg_parser = argparse.ArgumentParser(description="Tier old article bodies into cold storage.")
+    arg_parser.add_argument("--days", type=int, default=int(os.getenv('ARTICLE_COLD_AFTER_DAYS', '90')))
+    arg_parser.add_argument("--batch-size", type=int, default=500)
+    args = arg_parser.parse_args()
+
+    older_than = datetime.now(timezone.utc) - timedelta(days=args.days)
+    async with DatabaseConfig.lifespan():
+        article_crud = ArticleCRUD()
+        await article_crud.ensure_indexes()
+        moved = await article_crud.move_to_cold_tier(older_than, batch_size=args.batch_size)
+    print(f"✅ Moved {moved} article bodies older than {older_than:%Y-%m-%d} (or inactive) to the cold tier")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+"""
+Content-addressed archive of fetched HTML.
+
+Pages are stored once per content hash as gzip files under
+`<root>/objects/<sha[:2]>/<sha>.html.gz`; a SQLite index maps URLs and fetch
+times to hashes (plus the listing metadata of article pages), so the corpus
+can be re-extracted offline.
+"""
+import gzip
+import json
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Iterator, NamedTuple, Optional
+
+from scrapling import Adaptor
+
+DEFAULT_ARCHIVE_DIR = 'data/html_archive'
+
+
+class ArchiveRecord(NamedTuple):
+    url: str
+    sha256: str
+    status: int
+    fetched_at: str
+    metadata: dict
+
+
+class ArchivedPage(Adaptor):
+    """An archived page exposing the same `status`/`headers` as a live fetch response."""
+
+    def __init__(self, html: bytes, url: str, status: int = 200):
+        super().__init__(body=html, url=url, auto_match=False)
+        self.status = status
+        self.headers = {}
+        self.raw_html = html
+
+
+class HtmlArchive:
+    def __init__(self, root: Optional[str] = None, compress_level: int = 6):
+        self.root = root or os.getenv('SCRAPER_ARCHIVE_DIR', DEFAULT_ARCHIVE_DIR)
+        self.compress_level = compress_level
+        os.makedirs(os.path.join(self.root, 'objects'), exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS fetches ("
+                " url TEXT NOT NULL,"
+                " fetched_at TEXT NOT NULL,"
+                " sha256 TEXT NOT NULL,"
+                " status INTEGER NOT NULL,"
+                " metadata TEXT NOT NULL DEFAULT '{}')"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS fetches_url_time ON fetches (url, fetched_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # Scrapers run in several threads; SQLite connections are per thread
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(os.path.join(self.root, 'index.sqlite3'), timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def _object_path(self, sha256: str) -> str:
+        return os.path.join(self.root, 'objects', sha256[:2], f'{sha256}.html.gz')
+
+    def put(self, url: str, html: bytes, status: int = 200, metadata: Optional[dict] = None) -> str:
+        """Store a fetched page; identical content is written only once."""
+        sha256 = hashlib.sha256(html).hexdigest()
+        path = self._object_path(sha256)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=self.compress_level, mtime=0) as out:
+                out.write(html)
+            os.replace(tmp_path, path)
+
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT INTO fetches (url, fetched_at, sha256, status, metadata) VALUES (?, ?, ?, ?, ?)",
+                (url, datetime.now(timezone.utc).isoformat(), sha256, status, json.dumps(metadata or {}, default=str))
+            )
+        return sha256
+
+    def annotate(self, url: str, metadata: dict) -> None:
+        """Attach listing metadata (title, publish date) to the latest fetch of a URL."""
+        with self._connection() as connection:
+            connection.execute(
+                "UPDATE fetches SET metadata = ? WHERE rowid = ("
+                " SELECT rowid FROM fetches WHERE url = ? ORDER BY fetched_at DESC LIMIT 1)",
+                (json.dumps(metadata, default=str), url)
+            )
+
+    def read(self, sha256: str) -> bytes:
+        with gzip.open(self._object_path(sha256), 'rb') as f:
+            return f.read()
+
+    @staticmethod
+    def _record(row) -> ArchiveRecord:
+        url, sha256, status, fetched_at, metadata = row
+        return ArchiveRecord(url, sha256, status, fetched_at, json.loads(metadata))
+
+    def latest(self, url: str) -> Optional[ArchiveRecord]:
+        row = self._connection().execute(
+            "SELECT url, sha256, status, fetched_at, metadata FROM fetches"
+            " WHERE url = ? ORDER BY fetched_at DESC LIMIT 1",
+            (url,)
+        ).fetchone()
+        return self._record(row) if row else None
+
+    def latest_records(self, url_prefix: str = '') -> Iterator[ArchiveRecord]:
+        """Latest fetch of every archived URL starting with `url_prefix`."""
+        rows = self._connection().execute(
+            "SELECT url, sha256, status, MAX(fetched_at), metadata FROM fetches"
+            " WHERE url >= ? AND url < ? GROUP BY url ORDER BY url",
+            (url_prefix, url_prefix + '\uffff')
+        )
+        for row in rows:
+            yield self._record(row)
+
+    def page(self, url: str) -> Optional[ArchivedPage]:
+        record = self.latest(url)
+        if record is None:
+            return None
+        return ArchivedPage(self.read(record.sha256), record.url, record.status)
@@ -1,18 +1,198 @@
+import os
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 from dateutil import parser
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from scrapling import StealthyFetcher
 
+from src.web_scraper.archive import HtmlArchive
+from src.models.article import Article, ScrapingResult, ensure_utc
+from src.models.enums import ScraperStatus
+from src.web_scraper.exceptions import ScraperError, FetchError, ResourceBudgetExceeded
+from src.web_scraper.feeds import newest_entries, read_chunks
+from src.web_scraper.parsing import submit_parse
+from src.web_scraper.rate_limiter import AdaptiveRateLimiter, CircuitBreaker, RetryPolicy
+from src.web_scraper.resource_monitor import ResourceMonitor, release_memory
+from src.web_scraper.resource_policy import ResourcePolicy
+
 
 class BaseNewsScraper(ABC):
+    RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+    # Article body location, parsed off-thread by src.web_scraper.parsing
+    content_spec = None
+    # Element that marks the listing page as rendered
+    listing_selector = None
+    # What the browser may load; pages are ready once the listing/content selector is attached
+    resource_policy = ResourcePolicy()
+    # RSS/Atom feeds or sitemaps tried before rendering the HTML listing page
+    feed_urls = ()
+    # Only sitemap/feed URLs under this prefix are articles (defaults to base_url)
+    feed_url_prefix = None
+    feed_user_agent = 'Mozilla/5.0 (compatible; news-scraper/1.0)'
+
+    # Shared by every scraper in the process so per-host and per-source state
+    # survives across scraper instances.
+    _rate_limiter = None
+    _rate_limiter_lock = threading.Lock()
+    _circuit_breakers = {}
+    _circuit_breakers_lock = threading.Lock()
+    _archive = None
+    _archive_lock = threading.Lock()
+
     def __init__(self, base_url, source):
         self.fetcher = StealthyFetcher(auto_match=False)
         self.base_url = base_url
         self.source = source
         self.article_data = []
+        self.failed_articles = []
         self.max_articles = 4
+        self.retry_policy = RetryPolicy()
+        # off: no archive, record: store every fetched page, replay: serve pages from the archive only
+        self.archive_mode = os.getenv('SCRAPER_ARCHIVE_MODE', 'record').lower()
+        self.resource_monitor = ResourceMonitor()
+        self.last_result = None
+
+    @property
+    def rate_limiter(self):
+        # Created on first use so that SCRAPER_* settings from .env are already loaded
+        with BaseNewsScraper._rate_limiter_lock:
+            if BaseNewsScraper._rate_limiter is None:
+                BaseNewsScraper._rate_limiter = AdaptiveRateLimiter()
+            return BaseNewsScraper._rate_limiter
+
+    @property
+    def circuit_breaker(self):
+        with BaseNewsScraper._circuit_breakers_lock:
+            if self.source not in BaseNewsScraper._circuit_breakers:
+                BaseNewsScraper._circuit_breakers[self.source] = CircuitBreaker(self.source)
+            return BaseNewsScraper._circuit_breakers[self.source]
+
+    @property
+    def archive(self):
+        with BaseNewsScraper._archive_lock:
+            if BaseNewsScraper._archive is None:
+                BaseNewsScraper._archive = HtmlArchive()
+            return BaseNewsScraper._archive
+
+    def _fetch(self, url, wait_selector=None, **kwargs):
+        """Fetch a page through the per-host rate limiter, retries and the source's circuit breaker."""
+        if self.archive_mode == 'replay':
+            page = self.archive.page(url)
+            if page is None:
+                raise FetchError(url, message=f"{url} is not in the HTML archive")
+            return page
+
+        self._enforce_budget()
+        fetch_kwargs = {**self.resource_policy.fetch_kwargs(wait_selector), **kwargs}
+
+        def send():
+            try:
+                return self.fetcher.fetch(url, **fetch_kwargs)
+            except PlaywrightTimeoutError as e:
+                if 'wait_selector' not in fetch_kwargs or not self._is_selector_timeout(e):
+                    raise
+            # The page loaded but the selector never showed up (layout change, empty page).
+            # Retrying would wait just as long again, so take the page as it is.
+            print(f"Selector {fetch_kwargs['wait_selector']!r} not found on {url}; using the page without it")
+            return self.fetcher.fetch(url, **{
+                key: value for key, value in fetch_kwargs.items() if not key.startswith('wait_selector')
+            })
+
+        page = self._request(url, send)
+
+        if self.archive_mode == 'record' and page.status == 200:
+            try:
+                self.archive.put(url, self._page_html(page), page.status)
+            except (OSError, sqlite3.Error) as e:
+                # Archiving is best-effort (e.g. "database is locked" with several workers)
+                print(f"Error archiving {url}: {e}")
+        return page
+
+    @staticmethod
+    def _is_selector_timeout(error):
+        """True for a timeout of the wait_selector step, as opposed to navigation timeouts."""
+        message = str(error)
+        return 'Locator.wait_for' in message or 'waiting for locator' in message
+
+    def _request(self, url, send):
+        """
+        Run `send()` (returning a response with `status` and `headers`) with
+        jittered exponential retries on exceptions and retryable status codes.
+        A Retry-After longer than the policy's max_delay is not waited for:
+        the fetch fails at once and counts against the circuit breaker.
+        Raises FetchError when every attempt failed.
+        """
+        self.circuit_breaker.check()
+        last_error = None
+
+        for attempt in range(self.retry_policy.attempts):
+            self.rate_limiter.acquire(url)
+            retry_after = None
+            try:
+                response = send()
+            except Exception as e:
+                last_error = FetchError(url, message=f"Failed to fetch {url}: {e}")
+            else:
+                headers = getattr(response, 'headers', None) or {}
+                retry_after = self.rate_limiter.parse_retry_after(headers.get('retry-after') or headers.get('Retry-After'))
+                self.rate_limiter.record(url, response.status, retry_after)
+                if response.status not in self.RETRYABLE_STATUSES:
+                    self.circuit_breaker.record_success()
+                    return response
+                last_error = FetchError(url, response.status)
+                # Discarded responses (e.g. urllib's HTTPError for feeds) hold an open connection
+                close = getattr(response, 'close', None)
+                if callable(close):
+                    close()
+                if retry_after and retry_after > self.retry_policy.max_delay:
+                    last_error = FetchError(
+                        url, response.status,
+                        message=f"Failed to fetch {url} (Status Code: {response.status}), Retry-After {retry_after:.0f}s exceeds {self.retry_policy.max_delay:.0f}s",
+                    )
+                    break
+
+            if attempt + 1 < self.retry_policy.attempts:
+                delay = self.retry_policy.delay(attempt, minimum=retry_after or 0.0)
+                print(f"{last_error}; retrying in {delay:.1f}s (attempt {attempt + 2}/{self.retry_policy.attempts})")
+                time.sleep(delay)
+
+        self.circuit_breaker.record_failure()
+        raise last_error
+
+    def _recycle_fetcher(self):
+        """
+        Replace the fetcher and release memory. StealthyFetcher starts and
+        closes a browser per fetch, so there is no browser to restart: what
+        a recycle frees is this process's garbage and heap (see release_memory),
+        and the caller then waits for exiting browsers to go away.
+        """
+        self.fetcher = StealthyFetcher(auto_match=False)
+        release_memory()
+        self.resource_monitor.recycles += 1
+
+    def _enforce_budget(self):
+        """Recycle the fetcher or abort the run when the resource budget is exceeded."""
+        violation = self.resource_monitor.violation(self.resource_monitor.sample())
+        if violation is None:
+            return
+
+        if self.resource_monitor.budget.action == 'recycle':
+            print(f"Resource budget exceeded for {self.source} ({violation}), recycling fetcher")
+            self._recycle_fetcher()
+            violation = self.resource_monitor.settle()
+            if violation is None:
+                return
+
+        raise ResourceBudgetExceeded(f"Resource budget exceeded for {self.source}: {violation}")
 
     def _extract_page(self):
-        page = self.fetcher.fetch(self.base_url)
+        page = self._fetch(self.base_url, wait_selector=self.listing_selector)
         print(f"Status Code for {self.source}: {page.status}")
         return page
 
@@ -24,36 +204,169 @@ class BaseNewsScraper(ABC):
     def _extract_articles(self):
         pass
 
-    def _extract_article_elements(self):
+    def _open_feed(self, feed_url):
+        request = urllib.request.Request(feed_url, headers={'User-Agent': self.feed_user_agent})
+        try:
+            return urllib.request.urlopen(request, timeout=self.resource_policy.timeout / 1000)
+        except urllib.error.HTTPError as e:
+            # HTTPError is a response too; let _request look at its status
+            return e
+
+    def _is_feed_article(self, entry):
+        prefix = self.feed_url_prefix or self.base_url
+        return entry.url.startswith(prefix) and entry.url.rstrip('/') != prefix.rstrip('/')
+
+    def _discover_from_feeds(self):
+        """Newest articles from the first feed/sitemap that yields any, or None."""
+        for feed_url in self.feed_urls:
+            try:
+                response = self._request(feed_url, lambda: self._open_feed(feed_url))
+            except ScraperError as e:
+                print(f"Feed {feed_url} unavailable: {e}")
+                continue
+
+            with response:
+                if response.status != 200:
+                    print(f"Feed {feed_url} unavailable (Status Code: {response.status})")
+                    continue
+                entries = newest_entries(read_chunks(response), self.max_articles, self._is_feed_article)
+
+            if entries:
+                print(f"Found {len(entries)} articles for {self.source} in feed {feed_url}")
+                return [
+                    {
+                        'article_name': entry.title,
+                        'article_link': entry.url,
+                        'publish_date': entry.publish_date,
+                    }
+                    for entry in entries
+                ]
+        return None
+
+    def _discover_from_listing(self):
+        """Newest articles from the rendered HTML listing page, or -1 when it has none."""
         articles = self._extract_articles()
         if articles == -1:
             return -1
 
         articles = articles[:min(len(articles), self.max_articles)]
 
+        entries = []
         for article in articles:
             try:
-                article_title = self._extract_title(article)
-                article_url = self._extract_url(article)
-                article_publish_date = self._extract_publish_date(article)
-                article_content = self._extract_article_content(article_url)
-
-                article_data = {
-                    'article_source': self.source,
-                    'article_name': article_title,
-                    'article_link': article_url,
-                    'publish_date': article_publish_date,
-                    'article_content': article_content
-                }
-
-                self._print_article_detail(article_data)
-                self.article_data.append(article_data)
+                entries.append({
+                    'article_name': self._extract_title(article),
+                    'article_link': self._extract_url(article),
+                    'publish_date': self._extract_publish_date(article),
+                })
             except Exception as e:
                 print(f"Error extracting article details: {e}")
                 continue
+        return entries
+
+    def _discover_from_archive(self):
+        """Replay counterpart of feed discovery: the newest archived articles of this source."""
+        records = sorted(
+            self._archived_entries(),
+            key=lambda item: (item[1]['publish_date'] or datetime.min.replace(tzinfo=timezone.utc), item[0].fetched_at),
+            reverse=True
+        )
+        entries = [entry for record, entry in records[:self.max_articles]]
+        if entries:
+            print(f"Found {len(entries)} archived articles for {self.source}")
+        return entries
 
+    def _discover_articles(self):
+        entries = None
+        if self.feed_urls:
+            # Feed responses are not archived; replays take the articles from the archive itself
+            entries = self._discover_from_archive() if self.archive_mode == 'replay' else self._discover_from_feeds()
+        if entries:
+            return entries
+        return self._discover_from_listing()
+
+    def discover(self):
+        """Listing step only: newest article entries (name, link, publish date) of this source."""
+        entries = self._discover_articles()
+        return [] if entries == -1 else entries
+
+    def scrape_entries(self, entries):
+        """Article step only: fetch and parse the given listing entries; returns article dicts."""
+        self.article_data = []
+        self.failed_articles = []
+
+        # Fetch pages one after another while earlier pages are parsed in the process pool
+        pending = []
+        for entry in entries:
+            article_data = {'article_source': self.source, **entry}
+            pending.append((article_data, self._submit_article_content(entry['article_link'])))
+
+        self._collect_articles(pending)
         return self.article_data
 
+    def _extract_article_elements(self):
+        entries = self._discover_articles()
+        if entries == -1:
+            return -1
+        return self.scrape_entries(entries)
+
+    def _collect_articles(self, pending):
+        """Wait for parse results and keep the articles that have content."""
+        for article_data, parsed in pending:
+            try:
+                result = parsed.result() if parsed is not None else None
+            except Exception as e:
+                print(f"Error parsing article {article_data['article_link']}: {e}")
+                result = None
+
+            if not result or not result['article_content']:
+                # Keep the article out of the batch instead of failing validation later
+                print(f"Skipping article without content: {article_data['article_link']}")
+                self.failed_articles.append(article_data)
+                continue
+
+            article_data['article_content'] = result['article_content']
+            if not article_data['article_name']:
+                # Sitemaps carry no titles; use the one parsed from the article page
+                article_data['article_name'] = result.get('article_name') or "No Title"
+
+            if self.archive_mode == 'record':
+                try:
+                    self.archive.annotate(article_data['article_link'], {
+                        'article_name': article_data['article_name'],
+                        'publish_date': article_data['publish_date'],
+                    })
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Error annotating archived {article_data['article_link']}: {e}")
+            self._print_article_detail(article_data)
+            self.article_data.append(article_data)
+
+    def replay_archive(self):
+        """Re-extract every archived article page of this source, without touching the network."""
+        self.article_data = []
+        self.failed_articles = []
+
+        pending = []
+        for record, entry in self._archived_entries():
+            article_data = {'article_source': self.source, **entry}
+            pending.append((article_data, submit_parse(self.archive.read(record.sha256), record.url, self.content_spec)))
+
+        self._collect_articles(pending)
+        return self.article_data
+
+    def _archived_entries(self):
+        """(record, listing entry) for every archived article page of this source, named and dated from its annotation."""
+        prefix = self.feed_url_prefix or self.base_url
+        for record in self.archive.latest_records(prefix):
+            if record.status != 200 or record.url.rstrip('/') == self.base_url.rstrip('/'):
+                continue
+            publish_date = record.metadata.get('publish_date')
+            yield record, {
+                'article_name': record.metadata.get('article_name'),
+                'article_link': record.url,
+                'publish_date': self._parse_date(publish_date) if publish_date else None,
+            }
+
     @abstractmethod
     def _extract_title(self, article):
         pass
@@ -66,9 +379,46 @@ class BaseNewsScraper(ABC):
     def _extract_publish_date(self, article):
         pass
 
-    @abstractmethod
+    @staticmethod
+    def _page_html(page):
+        """Raw HTML of a fetched page as bytes."""
+        html = getattr(page, 'raw_html', None) or getattr(page, 'body', None) or page.html_content
+        return html.encode(getattr(page, 'encoding', None) or 'utf-8') if isinstance(html, str) else html
+
+    def _submit_article_content(self, article_url):
+        """Fetch an article page and hand its HTML to the parse pool; returns a Future or None."""
+        try:
+            page = self._fetch(article_url, wait_selector=self.content_spec.root)
+        except ResourceBudgetExceeded:
+            # Abort the whole run instead of skipping one article
+            raise
+        except ScraperError as e:
+            print(f"Error: {e}")
+            return None
+
+        if page.status != 200:
+            print(f"Error: Page {article_url} could not be loaded (Status Code: {page.status})")
+            return None
+
+        return submit_parse(self._page_html(page), article_url, self.content_spec)
+
     def _extract_article_content(self, article_url):
-        pass
+        parsed = self._submit_article_content(article_url)
+        result = parsed.result() if parsed is not None else None
+        if not result:
+            print(f"Error: Content not found: {article_url}")
+            return None
+        return result['article_content']
+
+    @staticmethod
+    def _parse_date(raw_date, **parser_kwargs):
+        """Parse a scraped date string into a timezone-aware UTC datetime (None if unparseable)."""
+        try:
+            publish_date = parser.parse(raw_date, **parser_kwargs)
+        except (ValueError, OverflowError) as e:
+            print(f"Error parsing date '{raw_date}': {e}")
+            return None
+        return ensure_utc(publish_date)
 
     def _print_article_detail(self, article_data):
         print(f"Source: {article_data['article_source']}")
@@ -79,5 +429,51 @@ class BaseNewsScraper(ABC):
         print(f"Content: {article_data['article_content']}")
         print("---")
 
+    def _build_result(self, started, error_message=None):
+        articles = []
+        for article_data in self.article_data:
+            try:
+                articles.append(Article(**article_data))
+            except Exception:
+                pass
+
+        failed = len(self.failed_articles) + len(self.article_data) - len(articles)
+        if error_message and not articles:
+            status = ScraperStatus.FAILED
+        elif error_message or failed:
+            status = ScraperStatus.PARTIAL if articles else ScraperStatus.FAILED
+        else:
+            status = ScraperStatus.SUCCESS
+
+        return ScrapingResult(
+            status=status,
+            articles=articles,
+            error_message=error_message,
+            execution_time=time.monotonic() - started,
+            stats={
+                'attempted': len(self.article_data) + len(self.failed_articles),
+                'successful': len(articles),
+                'failed': failed,
+                'skipped': 0,
+            },
+            resources=self.resource_monitor.stop(),
+        )
+
     def scrape(self):
-        return self._extract_article_elements()
+        # Scrapers are reused across runs by the scheduler; start from a clean slate
+        self.article_data = []
+        self.failed_articles = []
+        started = time.monotonic()
+        self.resource_monitor.start()
+        error_message = None
+        try:
+            articles = self._extract_article_elements()
+            if articles == -1:
+                error_message = f"Main content not found in {self.base_url}"
+        except ScraperError as e:
+            print(f"Scraping {self.source} stopped: {e}")
+            error_message = str(e)
+        finally:
+            self.last_result = self._build_result(started, error_message)
+            print(f"Resources for {self.source}: {self.last_result.resources}")
+        return self.article_data
@@ -0,0 +1,24 @@
+class ScraperError(Exception):
+    """Base class for scraper errors."""
+
+
+class FetchError(ScraperError):
+    """Raised when a page could not be fetched after all retries."""
+
+    def __init__(self, url, status=None, message=None):
+        self.url = url
+        self.status = status
+        super().__init__(message or f"Failed to fetch {url} (Status Code: {status})")
+
+
+class CircuitOpenError(ScraperError):
+    """Raised when requests to a source are suspended by its circuit breaker."""
+
+    def __init__(self, source, retry_in):
+        self.source = source
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {source}, retrying in {retry_in:.0f}s")
+
+
+class ResourceBudgetExceeded(ScraperError):
+    """Raised when a scraper run exceeds its resource budget and cannot recover."""
@@ -0,0 +1,96 @@
+"""
+Incremental RSS / Atom / sitemap parsing.
+
+Feeds are parsed from a byte stream with XMLPullParser, so only the entry
+being read is kept in memory and a listing costs a few KB of XML instead of
+a browser render.
+"""
+import heapq
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional
+from xml.etree.ElementTree import XMLPullParser, ParseError
+
+from dateutil import parser
+
+from src.models.article import ensure_utc
+
+CHUNK_SIZE = 16 * 1024
+
+
+class FeedEntry(NamedTuple):
+    url: str
+    title: Optional[str]
+    publish_date: Optional[object]
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _parse_date(raw_date: Optional[str]):
+    if not raw_date:
+        return None
+    try:
+        publish_date = parser.parse(raw_date.strip())
+    except (ValueError, OverflowError):
+        return None
+    return ensure_utc(publish_date)
+
+
+def _entry_from_element(element) -> Optional[FeedEntry]:
+    url = title = raw_date = None
+    for child in element:
+        name = _local_name(child.tag)
+        text = (child.text or '').strip()
+        if name == 'loc' or (name == 'link' and text):
+            url = text
+        elif name == 'link' and child.get('rel', 'alternate') == 'alternate':
+            # Atom: <link rel="alternate" href="..."/>
+            url = child.get('href')
+        elif name == 'title':
+            title = text or None
+        elif name in ('pubDate', 'published', 'lastmod', 'date') or (name == 'updated' and raw_date is None):
+            raw_date = text
+    if not url:
+        return None
+    return FeedEntry(url.strip(), title, _parse_date(raw_date))
+
+
+def iter_feed_entries(chunks: Iterable[bytes]) -> Iterator[FeedEntry]:
+    """Yield entries of an RSS, Atom or sitemap document fed as byte chunks."""
+    pull_parser = XMLPullParser(events=('end',))
+    for chunk in chunks:
+        pull_parser.feed(chunk)
+        for _, element in pull_parser.read_events():
+            # <item> (RSS), <entry> (Atom), <url> (sitemap); nested sitemap indexes are not followed
+            if _local_name(element.tag) in ('item', 'entry', 'url'):
+                entry = _entry_from_element(element)
+                element.clear()
+                if entry is not None:
+                    yield entry
+    pull_parser.close()
+
+
+def read_chunks(response, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    while True:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def newest_entries(
+    chunks: Iterable[bytes],
+    limit: int,
+    accept: Optional[Callable[[FeedEntry], bool]] = None
+) -> List[FeedEntry]:
+    """The `limit` newest accepted entries; undated entries sort last."""
+    try:
+        entries = (entry for entry in iter_feed_entries(chunks) if accept is None or accept(entry))
+        return heapq.nlargest(
+            limit,
+            entries,
+            key=lambda entry: (entry.publish_date is not None, entry.publish_date.timestamp() if entry.publish_date else 0)
+        )
+    except ParseError as e:
+        print(f"Error parsing feed: {e}")
+        return []
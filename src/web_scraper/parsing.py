@@ -0,0 +1,164 @@
+"""
+CPU-bound article parsing, run in a process pool so that parsing scales
+across cores while fetch threads keep doing I/O.
+
+Work items are plain picklable values: the raw HTML bytes, the page URL and
+the site's ExtractionSpec. Results are compact dicts.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple, Optional, Set, Tuple
+
+import lxml.html
+
+BLOCK_TAGS = ('p', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre', 'figcaption', 'td')
+SKIP_TAGS = frozenset(('script', 'style', 'noscript', 'template', 'svg', 'nav', 'button', 'form', 'iframe'))
+BLOCK_SEPARATOR = "\n\n"
+
+
+class ExtractionSpec(NamedTuple):
+    """
+    Where a site keeps its article body.
+
+    `root` may match several elements (e.g. every prose section of a page);
+    they are read in document order. Text is emitted per block element, and
+    the body is capped at `max_chars`.
+    """
+    root: str
+    blocks: Tuple[str, ...] = BLOCK_TAGS
+    max_chars: int = 200_000
+
+
+def _iter_blocks(roots, block_tags):
+    """Yield the outermost block elements under `roots` in document order, visiting each node once."""
+    stack = list(reversed(roots))
+    while stack:
+        element = stack.pop()
+        tag = element.tag
+        if not isinstance(tag, str) or tag in SKIP_TAGS:
+            # Comments and processing instructions have non-string tags
+            continue
+        if tag in block_tags:
+            yield element
+            continue
+        stack.extend(reversed(element))
+
+
+def _block_text(element) -> str:
+    # Collapse whitespace so inline markup does not glue or split words
+    return " ".join("".join(element.itertext()).split())
+
+
+def extract_text(roots, spec: ExtractionSpec) -> str:
+    """Single pass over the content roots: block texts in document order, paragraph separated, capped."""
+    block_tags = frozenset(spec.blocks)
+    parts = []
+    size = 0
+    for block in _iter_blocks(roots, block_tags):
+        text = _block_text(block)
+        if not text:
+            continue
+        # The separator joining this block to the previous one counts toward the cap
+        separator = len(BLOCK_SEPARATOR) if parts else 0
+        remaining = spec.max_chars - size - separator
+        if remaining <= 0:
+            break
+        parts.append(text[:remaining])
+        size += separator + len(parts[-1])
+        if len(text) >= remaining:
+            break
+    return BLOCK_SEPARATOR.join(parts)
+
+
+def _outermost(elements):
+    """Drop matches nested inside an earlier match so no text is emitted twice."""
+    kept = []
+    for element in elements:
+        if not any(parent in kept for parent in element.iterancestors()):
+            kept.append(element)
+    return kept
+
+
+def extract_article(html: bytes, url: str, spec: ExtractionSpec) -> Optional[dict]:
+    """Parse one article page; returns None when the content root is missing."""
+    document = lxml.html.document_fromstring(html, base_url=url)
+    roots = _outermost(document.cssselect(spec.root))
+    if not roots:
+        return None
+
+    title = document.cssselect('h1') or document.cssselect('title')
+    return {
+        'article_name': (_block_text(title[0]) or None) if title else None,
+        'article_content': extract_text(roots, spec),
+    }
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def parse_workers() -> int:
+    """Number of parse processes (SCRAPER_PARSE_WORKERS); 0 parses inline in the calling thread."""
+    return int(os.getenv('SCRAPER_PARSE_WORKERS', os.cpu_count() or 1))
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    workers = parse_workers()
+    if workers <= 0:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            # Scrapers run in threads; spawn avoids forking a multi-threaded process
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+def submit_parse(html: bytes, url: str, spec: ExtractionSpec) -> Future:
+    """Schedule `extract_article` on the parse pool (or run it inline when disabled)."""
+    pool = get_parse_pool()
+    if pool is not None:
+        try:
+            return pool.submit(extract_article, html, url, spec)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed) and the executor stays unusable; start a new one
+            print("Parse pool is broken, restarting it")
+            _discard_pool(pool)
+            return get_parse_pool().submit(extract_article, html, url, spec)
+
+    future = Future()
+    try:
+        future.set_result(extract_article(html, url, spec))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    # Futures of a broken pool have already failed; nothing is left to wait for
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_pool_pids() -> Set[int]:
+    """PIDs of the live parse processes (empty when the pool has not started)."""
+    with _pool_lock:
+        if _pool is None:
+            return set()
+        # ProcessPoolExecutor keeps no public handle on its processes
+        return set((getattr(_pool, '_processes', None) or {}).keys())
+
+
+def shutdown_parse_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True)
+            _pool = None
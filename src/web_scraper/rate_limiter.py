@@ -0,0 +1,161 @@
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from src.web_scraper.exceptions import CircuitOpenError
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `acquire` blocks until a token is available."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def set_rate(self, rate):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def pause(self, seconds):
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-host token buckets that slow down when a host answers 429/503 and
+    speed back up (towards `max_rate`) after successful responses.
+
+    Rates are requests per second and default to SCRAPER_RATE_PER_HOST,
+    SCRAPER_MAX_RATE_PER_HOST and SCRAPER_BURST_PER_HOST from the environment.
+    A Retry-After pauses the host for at most `max_pause` seconds
+    (SCRAPER_MAX_RETRY_AFTER, default 30) so one header cannot stall every
+    scraper sharing the host.
+    """
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self, rate=None, max_rate=None, burst=None, min_rate=0.02, backoff=0.5, recovery=1.1, max_pause=None):
+        self.rate = rate or float(os.getenv('SCRAPER_RATE_PER_HOST', '1.0'))
+        self.max_rate = max_rate or float(os.getenv('SCRAPER_MAX_RATE_PER_HOST', '4.0'))
+        self.burst = burst or int(os.getenv('SCRAPER_BURST_PER_HOST', '2'))
+        self.max_pause = max_pause or float(os.getenv('SCRAPER_MAX_RETRY_AFTER', '30'))
+        self.min_rate = min_rate
+        self.backoff = backoff
+        self.recovery = recovery
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url):
+        return urlparse(url).netloc.lower()
+
+    def _bucket(self, url):
+        host = self._host(url)
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url):
+        self._bucket(url).acquire()
+
+    def record(self, url, status, retry_after=None):
+        """Adapt the host's rate to the status code of its latest response."""
+        bucket = self._bucket(url)
+        if status in self.THROTTLE_STATUSES:
+            bucket.set_rate(max(self.min_rate, bucket.rate * self.backoff))
+            if retry_after:
+                bucket.pause(min(retry_after, self.max_pause))
+            print(f"Throttled by {self._host(url)} (Status Code: {status}), rate now {bucket.rate:.2f} req/s")
+        elif status is not None and status < 400:
+            bucket.set_rate(min(self.max_rate, bucket.rate * self.recovery))
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Return the Retry-After header as seconds, accepting delta-seconds or an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    def __init__(self, attempts=4, base_delay=1.0, max_delay=30.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt, minimum=0.0):
+        return max(minimum, random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a source after `failure_threshold` consecutive failures.
+    After `reset_timeout` seconds a single trial request is let through
+    (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, source, failure_threshold=5, reset_timeout=300.0):
+        self.source = source
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def check(self):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            elapsed = time.monotonic() - self.opened_at
+            if elapsed < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError(self.source, max(0.0, self.reset_timeout - elapsed))
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                print(f"Circuit opened for {self.source} after {self.failures} consecutive failures")
@@ -0,0 +1,22 @@
+from src.models.enums import NewsSource
+from src.web_scraper.sites.anthropic_news_scraper import AnthropicNewsScraper
+from src.web_scraper.sites.deepseek_news_scraper import DeepSeekNewsScraper
+from src.web_scraper.sites.groq_news_scraper import GroqNewsScraper
+from src.web_scraper.sites.grok_news_scraper import GrokNewsScraper
+from src.web_scraper.sites.meta_news_scraper import MetaNewsScraper
+from src.web_scraper.sites.openai_news_scraper import OpenAINewsScraper
+
+
+SCRAPERS = {
+    NewsSource.ANTHROPIC: AnthropicNewsScraper,
+    NewsSource.DEEPSEEK: DeepSeekNewsScraper,
+    NewsSource.GROQ: GroqNewsScraper,
+    NewsSource.GROK: GrokNewsScraper,
+    NewsSource.META: MetaNewsScraper,
+    NewsSource.OPENAI: OpenAINewsScraper,
+}
+
+
+def get_scraper_class(source):
+    """Return the scraper class for a NewsSource (or its string value)."""
+    return SCRAPERS[NewsSource(source)]
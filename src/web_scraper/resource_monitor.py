@@ -0,0 +1,268 @@
+"""
+Per-run resource accounting for scrapers: process RSS, memory of child
+(browser) processes, open file descriptors and, in debug mode, the top
+tracemalloc allocation sites.
+
+All numbers are per process, not per scraper: when several scrapers run in
+one process (the scheduler), each run sees the RSS, browsers and descriptors
+of the others as well. Parse pool workers are left out of the child figures;
+their memory does not depend on the scraper and recycling cannot free it.
+
+Budgets come from the environment:
+
+    SCRAPER_MAX_RSS_MB         own RSS limit
+    SCRAPER_MAX_CHILD_RSS_MB   total RSS limit of child (browser) processes
+    SCRAPER_MAX_OPEN_FDS       open file descriptor limit
+    SCRAPER_BUDGET_ACTION      recycle (default): release memory and retry first; abort: stop the run
+    SCRAPER_BUDGET_GRACE_S     seconds to wait for resources to drop after a recycle (default 5)
+    SCRAPER_TRACEMALLOC        1 to record top allocations
+"""
+import ctypes
+import gc
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from .parsing import parse_pool_pids
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+try:
+    _libc = ctypes.CDLL('libc.so.6') if sys.platform.startswith('linux') else None
+except OSError:
+    _libc = None
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name, '').strip()
+    return float(value) if value else None
+
+
+@dataclass
+class ResourceBudget:
+    max_rss_mb: Optional[float] = None
+    max_child_rss_mb: Optional[float] = None
+    max_open_fds: Optional[float] = None
+    action: str = 'recycle'
+    grace_seconds: float = 5.0
+
+    @classmethod
+    def from_env(cls) -> "ResourceBudget":
+        return cls(
+            max_rss_mb=_env_float('SCRAPER_MAX_RSS_MB'),
+            max_child_rss_mb=_env_float('SCRAPER_MAX_CHILD_RSS_MB'),
+            max_open_fds=_env_float('SCRAPER_MAX_OPEN_FDS'),
+            action=os.getenv('SCRAPER_BUDGET_ACTION', 'recycle').lower(),
+            grace_seconds=_env_float('SCRAPER_BUDGET_GRACE_S') or 5.0,
+        )
+
+
+def _proc_rss_mb(pid: int) -> float:
+    with open(f'/proc/{pid}/statm') as f:
+        return int(f.read().split()[1]) * _PAGE_SIZE / 1024 / 1024
+
+
+def _proc_children(pid: int) -> List[int]:
+    """Descendants of `pid` from /proc (fallback when psutil is not installed)."""
+    parents: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; ppid is the second field after it
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        parents.setdefault(ppid, []).append(int(entry))
+
+    children, stack = [], [pid]
+    while stack:
+        for child in parents.get(stack.pop(), []):
+            children.append(child)
+            stack.append(child)
+    return children
+
+
+def _excluded_children() -> Set[int]:
+    """Parse pool workers and anything they started."""
+    excluded = parse_pool_pids()
+    for pid in list(excluded):
+        if psutil is None:
+            excluded.update(_proc_children(pid))
+            continue
+        try:
+            excluded.update(child.pid for child in psutil.Process(pid).children(recursive=True))
+        except psutil.Error:
+            pass
+    return excluded
+
+
+def sample_resources() -> Dict[str, float]:
+    """
+    Current RSS (MB), total child RSS (MB), child count and open file
+    descriptors of this process. Parse pool workers are not counted as children.
+    """
+    if psutil is not None:
+        process = psutil.Process()
+        excluded = _excluded_children()
+        children = [child for child in process.children(recursive=True) if child.pid not in excluded]
+        child_rss = 0
+        for child in children:
+            try:
+                child_rss += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return {
+            'rss_mb': process.memory_info().rss / 1024 / 1024,
+            'child_rss_mb': child_rss / 1024 / 1024,
+            'child_processes': len(children),
+            'open_fds': process.num_fds() if hasattr(process, 'num_fds') else 0,
+        }
+
+    if not sys.platform.startswith('linux'):
+        # Without psutil only the peak RSS from getrusage is available
+        return {'rss_mb': 0.0, 'child_rss_mb': 0.0, 'child_processes': 0, 'open_fds': 0}
+
+    pid = os.getpid()
+    child_rss = 0.0
+    excluded = _excluded_children()
+    children = [child for child in _proc_children(pid) if child not in excluded]
+    for child in children:
+        try:
+            child_rss += _proc_rss_mb(child)
+        except OSError:
+            pass
+    return {
+        'rss_mb': _proc_rss_mb(pid),
+        'child_rss_mb': child_rss,
+        'child_processes': len(children),
+        'open_fds': len(os.listdir('/proc/self/fd')),
+    }
+
+
+def release_memory() -> None:
+    """
+    Collect garbage and, on glibc, return freed heap pages to the OS
+    (malloc_trim); without the trim, freed memory usually stays in the RSS.
+    """
+    gc.collect()
+    if _libc is not None and hasattr(_libc, 'malloc_trim'):
+        _libc.malloc_trim(0)
+
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, KB elsewhere
+    return max_rss / 1024 / 1024 if sys.platform == 'darwin' else max_rss / 1024
+
+
+class ResourceMonitor:
+    """Samples resources in a background thread while a scraper runs and keeps the peaks."""
+
+    def __init__(self, budget: Optional[ResourceBudget] = None, interval: float = 0.5, debug: Optional[bool] = None):
+        self.budget = budget or ResourceBudget.from_env()
+        self.interval = interval
+        self.debug = debug if debug is not None else os.getenv('SCRAPER_TRACEMALLOC', '') in ('1', 'true', 'yes')
+        self.recycles = 0
+        self._peaks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+
+    def _record(self, sample: Dict[str, float]) -> Dict[str, float]:
+        with self._lock:
+            for key, value in sample.items():
+                self._peaks[key] = max(self._peaks.get(key, 0), value)
+        return sample
+
+    def sample(self) -> Dict[str, float]:
+        return self._record(sample_resources())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except OSError:
+                pass
+
+    def start(self) -> None:
+        self._peaks = {}
+        self.recycles = 0
+        if self.debug and not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+            self._started_tracemalloc = True
+        self.sample()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='resource-monitor', daemon=True)
+        self._thread.start()
+
+    def violation(self, sample: Dict[str, float]) -> Optional[str]:
+        """Describe the first budget the sample exceeds, or None."""
+        checks = (
+            ('rss_mb', self.budget.max_rss_mb, 'RSS {value:.0f} MB exceeds {limit:.0f} MB'),
+            ('child_rss_mb', self.budget.max_child_rss_mb, 'browser RSS {value:.0f} MB exceeds {limit:.0f} MB'),
+            ('open_fds', self.budget.max_open_fds, '{value:.0f} open file descriptors exceed {limit:.0f}'),
+        )
+        for key, limit, message in checks:
+            if limit is not None and sample.get(key, 0) > limit:
+                return message.format(value=sample[key], limit=limit)
+        return None
+
+    def settle(self) -> Optional[str]:
+        """
+        Re-sample until the budget holds again or the grace period ends, and
+        return the violation left. Browsers and freed memory take a moment to
+        go away after a recycle.
+        """
+        deadline = time.monotonic() + self.budget.grace_seconds
+        while True:
+            violation = self.violation(self.sample())
+            if violation is None or time.monotonic() >= deadline:
+                return violation
+            time.sleep(self.interval)
+
+    def _top_allocations(self, limit: int = 10) -> List[str]:
+        snapshot = tracemalloc.take_snapshot()
+        return [str(stat) for stat in snapshot.statistics('lineno')[:limit]]
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop sampling and return the run's resource report."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.sample()
+
+        report: Dict[str, Any] = {
+            'peak_rss_mb': round(self._peaks.get('rss_mb', 0), 1),
+            'max_rss_mb': round(_max_rss_mb() or self._peaks.get('rss_mb', 0), 1),
+            'peak_child_rss_mb': round(self._peaks.get('child_rss_mb', 0), 1),
+            'peak_child_processes': int(self._peaks.get('child_processes', 0)),
+            'peak_open_fds': int(self._peaks.get('open_fds', 0)),
+            'fetcher_recycles': self.recycles,
+        }
+        if tracemalloc.is_tracing() and self.debug:
+            report['top_allocations'] = self._top_allocations()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        return report
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """
+    What the headless browser loads when rendering a page.
+
+    We only read text from the DOM, so by default images, fonts, media,
+    stylesheets and beacons are blocked (`disable_resources`), known ad and
+    analytics domains are filtered by the browser's ad blocker (`disable_ads`),
+    and the page counts as ready once `wait_selector` is attached instead of
+    waiting for the network to go idle.
+    """
+    block_images: bool = True
+    disable_resources: bool = True
+    disable_ads: bool = True
+    network_idle: bool = False
+    wait_selector: Optional[str] = None
+    wait_selector_state: str = 'attached'
+    timeout: int = 30000
+
+    def fetch_kwargs(self, wait_selector: Optional[str] = None) -> dict:
+        """StealthyFetcher.fetch keyword arguments for this policy."""
+        kwargs = {
+            'block_images': self.block_images,
+            'disable_resources': self.disable_resources,
+            'disable_ads': self.disable_ads,
+            'network_idle': self.network_idle,
+            'timeout': self.timeout,
+        }
+        wait_selector = wait_selector or self.wait_selector
+        if wait_selector:
+            kwargs['wait_selector'] = wait_selector
+            kwargs['wait_selector_state'] = self.wait_selector_state
+        return kwargs
@@ -1,8 +1,13 @@
-from dateutil import parser
 from src.web_scraper.base_news_scraper import BaseNewsScraper
+from src.web_scraper.parsing import ExtractionSpec
 
 
 class DeepSeekNewsScraper(BaseNewsScraper):
+    content_spec = ExtractionSpec('article.prose')
+    listing_selector = 'div.min-h-screen'
+    feed_urls = ('https://www.deepseekv3.com/sitemap.xml',)
+    feed_url_prefix = 'https://www.deepseekv3.com/en/blog/'
+
     def __init__(self):
         super().__init__(
             base_url='https://www.deepseekv3.com/en/blog',
@@ -10,7 +15,7 @@ class DeepSeekNewsScraper(BaseNewsScraper):
         )
 
     def _extract_main_content(self):
-        main_content = self._extract_page().css_first('div.min-h-screen')
+        main_content = self._extract_page().css_first(self.listing_selector)
         if not main_content:
             print(f'Main content not found in {self.base_url}')
             return -1
@@ -45,40 +50,11 @@ class DeepSeekNewsScraper(BaseNewsScraper):
         publish_date = None
 
         if article_date:
-            raw_date = article_date.text.strip()
-            try:
-                # Tarihi ISO formatına çevir
-                publish_date = parser.parse(raw_date).isoformat() + 'Z'
-            except Exception as e:
-                publish_date = None
+            # Tarihi UTC datetime'a çevir
+            publish_date = self._parse_date(article_date.text.strip())
 
         return publish_date
 
-    def _extract_article_content(self, article_url):
-        try:
-            page = self.fetcher.fetch(article_url)
-            if page.status != 200:
-                print(f"  Hata: Sayfa {article_url} başarıyla yüklenemedi (Status Code: {page.status})")
-                return None
-
-            article_html = page.css_first('article.prose')
-            if not article_html:
-                print(f"  Hata: İçerik div bulunamadı: {article_url}")
-                return None
-
-            content_paragraphs = article_html.css('p')
-            content_list_items = article_html.css('li')
-
-            paragraphs = [p.text.strip() for p in content_paragraphs if p.text.strip()]
-            list_items = [li.text.strip() for li in content_list_items if li.text.strip()]
-
-            content = "".join(paragraphs + list_items)
-
-            return content
-        except Exception as e:
-            print(f"  Hata: {e}")
-            return None
-
 
 if __name__ == '__main__':
     scraper = DeepSeekNewsScraper()
@@ -1,8 +1,13 @@
-from dateutil import parser
 from src.web_scraper.base_news_scraper import BaseNewsScraper
+from src.web_scraper.parsing import ExtractionSpec
 
 
 class GroqNewsScraper(BaseNewsScraper):
+    content_spec = ExtractionSpec('div.elementor-widget-theme-post-content div.elementor-widget-container')
+    listing_selector = 'div.elementor.elementor-3577.elementor-location-archive'
+    feed_urls = ('https://groq.com/category/blog/feed/',)
+    feed_url_prefix = 'https://groq.com/'
+
     def __init__(self):
         super().__init__(
             base_url='https://groq.com/category/blog/',
@@ -10,7 +15,7 @@ class GroqNewsScraper(BaseNewsScraper):
         )
 
     def _extract_main_content(self):
-        main_content = self._extract_page().css_first('div.elementor.elementor-3577.elementor-location-archive')
+        main_content = self._extract_page().css_first(self.listing_selector)
         if not main_content:
             print(f'Main content not found in {self.base_url}')
             return -1
@@ -44,38 +49,9 @@ class GroqNewsScraper(BaseNewsScraper):
         article_date = article.css_first('div.elementor-widget-post-info time')
         publish_date = None
         if article_date:
-            raw_date = article_date.text.strip()
-            try:
-                publish_date = parser.parse(raw_date).isoformat() + 'Z'
-            except Exception as e:
-                publish_date = None
+            publish_date = self._parse_date(article_date.text.strip())
         return publish_date
 
-    def _extract_article_content(self, article_url):
-        try:
-            page = self.fetcher.fetch(article_url)
-            if page.status != 200:
-                print(f"  Hata: Sayfa {article_url} başarıyla yüklenemedi (Status Code: {page.status})")
-                return None
-
-            article_html = page.css_first('div.elementor-widget-theme-post-content')
-            if not article_html:
-                print(f"  Hata: İçerik div bulunamadı: {article_url}")
-                return None
-
-            content_paragraphs = article_html.css('div.elementor-widget-container p')
-            content_list_items = article_html.css('div.elementor-widget-container li')
-
-            paragraphs = [p.text.strip() for p in content_paragraphs if p.text.strip()]
-            list_items = [li.text.strip() for li in content_list_items if li.text.strip()]
-
-            content = "".join(paragraphs + list_items)
-
-            return content
-        except Exception as e:
-            print(f"  Hata: {e}")
-            return None
-
 
 if __name__ == '__main__':
     scraper = GroqNewsScraper()
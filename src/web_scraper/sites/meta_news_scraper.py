@@ -1,8 +1,11 @@
-from dateutil import parser
 from src.web_scraper.base_news_scraper import BaseNewsScraper
+from src.web_scraper.parsing import ExtractionSpec
 
 
 class MetaNewsScraper(BaseNewsScraper):
+    content_spec = ExtractionSpec('div._a5ci')
+    listing_selector = 'div._7h8s'
+
     def __init__(self):
         super().__init__(
             base_url='https://ai.meta.com/blog/',
@@ -10,7 +13,7 @@ class MetaNewsScraper(BaseNewsScraper):
         )
 
     def _extract_main_content(self):
-        main_content = self._extract_page().css_first('div._7h8s')
+        main_content = self._extract_page().css_first(self.listing_selector)
         if not main_content:
             print(f'Main content not found in {self.base_url}')
             return -1
@@ -46,39 +49,10 @@ class MetaNewsScraper(BaseNewsScraper):
             date_divs = article_date.css('div._amdj')
             for div in date_divs:
                 if div.text.strip():
-                    raw_date = div.text.strip()
-                    try:
-                        publish_date = parser.parse(raw_date).isoformat() + 'Z'
-                    except Exception as e:
-                        publish_date = None
+                    publish_date = self._parse_date(div.text.strip())
                     break
         return publish_date
 
-    def _extract_article_content(self, article_url):
-        try:
-            page = self.fetcher.fetch(article_url)
-            if page.status != 200:
-                print(f"  Hata: Sayfa {article_url} başarıyla yüklenemedi (Status Code: {page.status})")
-                return None
-
-            article_html = page.css_first('div._a5ci')
-            if not article_html:
-                print(f"  Hata: İçerik div bulunamadı: {article_url}")
-                return None
-
-            content_paragraphs = article_html.css('p')
-            content_list_items = article_html.css('li')
-
-            paragraphs = [p.text.strip() for p in content_paragraphs if p.text.strip()]
-            list_items = [li.text.strip() for li in content_list_items if li.text.strip()]
-
-            content = "".join(paragraphs + list_items)
-
-            return content
-        except Exception as e:
-            print(f"  Hata: {e}")
-            return None
-
 
 if __name__ == '__main__':
     scraper = MetaNewsScraper()
@@ -1,9 +1,14 @@
 import re
-from dateutil import parser
 from src.web_scraper.base_news_scraper import BaseNewsScraper
+from src.web_scraper.parsing import ExtractionSpec
 
 
 class OpenAINewsScraper(BaseNewsScraper):
+    content_spec = ExtractionSpec('article.mt-2xl div.prose')
+    listing_selector = '#results'
+    feed_urls = ('https://openai.com/news/rss.xml',)
+    feed_url_prefix = 'https://openai.com/'
+
     def __init__(self):
         super().__init__(
             base_url='https://openai.com/news/',
@@ -11,7 +16,7 @@ class OpenAINewsScraper(BaseNewsScraper):
         )
 
     def _extract_main_content(self):
-        main_content = self._extract_page().css_first('#results')
+        main_content = self._extract_page().css_first(self.listing_selector)
         if not main_content:
             print(f'Main content not found in {self.base_url}')
             return -1
@@ -44,39 +49,9 @@ class OpenAINewsScraper(BaseNewsScraper):
         publish_date = None
 
         if article_date:
-            raw_date = article_date.text.strip()
-            try:
-                dt = parser.parse(raw_date)
-                publish_date = dt.isoformat()
-            except Exception:
-                pass
+            publish_date = self._parse_date(article_date.text.strip())
         return publish_date
 
-    def _extract_article_content(self, article_url):
-        try:
-            page = self.fetcher.fetch(article_url)
-            if page.status != 200:
-                print(f"  Hata: Sayfa {article_url} başarıyla yüklenemedi (Status Code: {page.status})")
-                return None
-
-            article_html = page.css_first('article.mt-2xl')
-            if not article_html:
-                print(f"  Hata: İçerik div bulunamadı: {article_url}")
-                return None
-
-            content_paragraphs = article_html.css('div.prose p span')
-            content_list_items = article_html.css('div.prose li')
-
-            paragraphs = [p.text.strip() for p in content_paragraphs if p.text.strip()]
-            list_items = [li.text.strip() for li in content_list_items if li.text.strip()]
-
-            content = "".join(paragraphs + list_items)
-
-            return content
-        except Exception as e:
-            print(f"  Hata: {e}")
-            return None
-
 
 if __name__ == '__main__':
     scraper = OpenAINewsScraper()
@@ -0,0 +1,200 @@
+"""
+Queue worker: claims jobs from the shared `scrape_jobs` collection and runs
+the matching scraper. Any number of workers, on any number of machines, can
+point at the same MongoDB.
+
+    python -m src.worker --enqueue                 # queue a listing job per source
+    python -m src.worker --processes 4             # run 4 local worker processes
+    python -m src.worker --processes 4 --drain     # exit once the queue is empty
+
+With --processes N each worker gets cpu_count // N parse processes unless
+SCRAPER_PARSE_WORKERS is set.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import uuid
+from typing import Dict, Iterable, Optional
+
+from dotenv import load_dotenv
+
+from src.database.config import DatabaseConfig
+from src.database.crud.article_crud import ArticleCRUD
+from src.database.crud.scrape_job_crud import ScrapeJobCRUD
+from src.models.enums import JobKind, NewsSource
+from src.models.scrape_job import ScrapeJob
+from src.pipeline import store_articles
+from src.web_scraper.parsing import shutdown_parse_pool
+from src.web_scraper.registry import SCRAPERS
+
+
+class Worker:
+    def __init__(self, worker_id: Optional[str] = None, lease_seconds: int = 600, poll_interval: float = 5.0):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.job_crud = ScrapeJobCRUD()
+        self.article_crud = ArticleCRUD()
+        # One warm scraper per source, created on first use
+        self.scrapers: Dict[NewsSource, object] = {}
+        self._stop: Optional[asyncio.Event] = None
+
+    def stop(self) -> None:
+        if self._stop is not None and not self._stop.is_set():
+            print(f"\nWorker {self.worker_id} stopping after the current job...")
+            self._stop.set()
+
+    def _scraper(self, source: NewsSource):
+        if source not in self.scrapers:
+            self.scrapers[source] = SCRAPERS[source]()
+        return self.scrapers[source]
+
+    async def run(self, drain: bool = False) -> int:
+        """Process jobs until stopped (or, with `drain`, until no job is available). Returns jobs processed."""
+        self._stop = asyncio.Event()
+        processed = 0
+        print(f"👷 Worker {self.worker_id} started")
+
+        while not self._stop.is_set():
+            job = await self.job_crud.claim(self.worker_id, self.lease_seconds)
+            if job is None:
+                if drain:
+                    break
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run_job(job)
+            processed += 1
+
+        print(f"Worker {self.worker_id} processed {processed} jobs")
+        return processed
+
+    async def _heartbeat(self, job: ScrapeJob) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not await self.job_crud.heartbeat(job, self.lease_seconds):
+                print(f"Lost lease on job {job.dedupe_key}")
+                return
+
+    async def _run_job(self, job: ScrapeJob) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await self._process(job)
+        except Exception as e:
+            print(f"Job {job.dedupe_key} failed (attempt {job.attempts}/{job.max_attempts}): {e}")
+            await self.job_crud.fail(job, str(e))
+        else:
+            await self.job_crud.complete(job)
+        finally:
+            heartbeat.cancel()
+
+    async def _process(self, job: ScrapeJob) -> None:
+        source = NewsSource(job.source)
+        scraper = self._scraper(source)
+
+        # Account resources per job; the report is stored on the job by complete()/fail()
+        scraper.resource_monitor.start()
+        try:
+            await self._run_step(job, source, scraper)
+        finally:
+            job.resources = scraper.resource_monitor.stop()
+            print(f"Resources for {job.dedupe_key}: {job.resources}")
+
+    async def _run_step(self, job: ScrapeJob, source: NewsSource, scraper) -> None:
+        if JobKind(job.kind) is JobKind.LISTING:
+            entries = await asyncio.to_thread(scraper.discover)
+            added = 0
+            for entry in entries:
+                added += await self.job_crud.enqueue(JobKind.ARTICLE, source, url=str(entry['article_link']), payload=entry)
+            print(f"Listing {source.value}: {len(entries)} articles found, {added} new jobs")
+            return
+
+        articles = await asyncio.to_thread(scraper.scrape_entries, [{**job.payload, 'article_link': job.url}])
+        if not articles:
+            raise RuntimeError(f"No content extracted from {job.url}")
+        stats = await store_articles(self.article_crud, articles)
+        if stats['failed']:
+            # Leave the job to fail() so it is retried; stored articles count as duplicates next time
+            raise RuntimeError(f"{stats['failed']} of {len(articles)} articles from {job.url} could not be stored")
+
+
+async def enqueue_listings(sources: Iterable[NewsSource]) -> None:
+    job_crud = ScrapeJobCRUD()
+    await job_crud.ensure_indexes()
+    for source in sources:
+        added = await job_crud.enqueue(JobKind.LISTING, source, rearm=True)
+        print(f"{'Queued' if added else 'Already queued'}: listing {source.value}")
+
+
+async def run_worker(drain: bool = False, lease_seconds: int = 600) -> None:
+    worker = Worker(lease_seconds=lease_seconds)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    async with DatabaseConfig.lifespan():
+        await worker.job_crud.ensure_indexes()
+        await worker.article_crud.ensure_indexes()
+        await worker.run(drain=drain)
+    shutdown_parse_pool()
+
+
+def _worker_process(drain: bool, lease_seconds: int, processes: int = 1) -> None:
+    if processes > 1 and not os.getenv('SCRAPER_PARSE_WORKERS'):
+        # Share the cores between sibling workers instead of giving each one a
+        # cpu_count-sized parse pool; 0 parses inline in the worker itself.
+        os.environ['SCRAPER_PARSE_WORKERS'] = str((os.cpu_count() or 1) // processes)
+    asyncio.run(run_worker(drain=drain, lease_seconds=lease_seconds))
+
+
+def main():
+    load_dotenv()
+    arg_parser = argparse.ArgumentParser(description="Run scraper queue workers.")
+    arg_parser.add_argument("--enqueue", action="store_true", help="Queue a listing job per source and exit.")
+    arg_parser.add_argument("--sources", help="Comma separated NewsSource values for --enqueue (default: all).")
+    arg_parser.add_argument("--processes", type=int, default=1, help="Number of local worker processes.")
+    arg_parser.add_argument("--drain", action="store_true", help="Exit when no job is available.")
+    arg_parser.add_argument("--lease-seconds", type=int, default=int(os.getenv('WORKER_LEASE_SECONDS', '600')))
+    args = arg_parser.parse_args()
+
+    if args.enqueue:
+        sources = [NewsSource(value.strip().upper()) for value in args.sources.split(',')] if args.sources else list(SCRAPERS)
+
+        async def _enqueue():
+            async with DatabaseConfig.lifespan():
+                await enqueue_listings(sources)
+
+        asyncio.run(_enqueue())
+        return
+
+    if args.processes <= 1:
+        _worker_process(args.drain, args.lease_seconds)
+        return
+
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(target=_worker_process, args=(args.drain, args.lease_seconds, args.processes), name=f"worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        # Children received the same SIGINT and finish their current job
+        for process in processes:
+            process.join()
+
+
+if __name__ == '__main__':
+    main()
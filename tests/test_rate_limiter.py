@@ -0,0 +1,29 @@
+"""Retry-After handling of the per-host rate limiter."""
+import time
+
+from src.web_scraper.rate_limiter import AdaptiveRateLimiter
+
+URL = "https://openai.com/news/"
+
+
+def test_retry_after_pause_is_capped():
+    limiter = AdaptiveRateLimiter(rate=1.0, max_rate=4.0, burst=2, max_pause=5)
+    limiter.record(URL, 429, retry_after=86_400)
+
+    bucket = limiter._bucket(URL)
+    assert bucket.paused_until - time.monotonic() <= 5
+    assert bucket.rate == 0.5
+
+
+def test_short_retry_after_is_honoured():
+    limiter = AdaptiveRateLimiter(rate=1.0, max_rate=4.0, burst=2, max_pause=30)
+    limiter.record(URL, 503, retry_after=2)
+
+    remaining = limiter._bucket(URL).paused_until - time.monotonic()
+    assert 1 < remaining <= 2
+
+
+def test_parse_retry_after_accepts_seconds_and_dates():
+    assert AdaptiveRateLimiter.parse_retry_after("120") == 120.0
+    assert AdaptiveRateLimiter.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert AdaptiveRateLimiter.parse_retry_after("soon") is None
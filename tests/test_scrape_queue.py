@@ -0,0 +1,150 @@
+"""
+Integration test of the scrape_jobs queue with several worker processes.
+
+Needs a local mongod; the URL comes from MONGODB_TEST_URL (default
+mongodb://localhost:27017) and the test is skipped when it is unreachable.
+
+    python -m pytest tests/test_scrape_queue.py
+"""
+import asyncio
+import multiprocessing
+import os
+import time
+
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from src.database.config import DatabaseConfig
+from src.database.crud.scrape_job_crud import ScrapeJobCRUD
+from src.models.enums import JobKind, JobStatus, NewsSource
+
+MONGODB_URL = os.getenv('MONGODB_TEST_URL', 'mongodb://localhost:27017')
+DB_NAME = 'article_scraper_queue_test'
+LEASE_SECONDS = 1
+PROCESSES = 4
+
+
+def _mongod_available() -> bool:
+    try:
+        MongoClient(MONGODB_URL, serverSelectionTimeoutMS=500).admin.command('ping')
+        return True
+    except PyMongoError:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _mongod_available(), reason=f"no mongod at {MONGODB_URL}")
+
+
+async def _queue_worker() -> None:
+    """
+    Claim jobs until the queue is settled. The payload decides what the job does:
+    crash (abandon the first lease), flaky (fail twice), broken (always fail).
+    """
+    async with DatabaseConfig.lifespan(MONGODB_URL, DB_NAME):
+        job_crud = ScrapeJobCRUD()
+        worker_id = f"test:{os.getpid()}"
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            job = await job_crud.claim(worker_id, LEASE_SECONDS)
+            if job is None:
+                counts = await job_crud.counts()
+                if not counts.get(JobStatus.PENDING.value) and not counts.get(JobStatus.RUNNING.value):
+                    return
+                await asyncio.sleep(0.1)
+                continue
+
+            behaviour = job.payload.get('behaviour')
+            if behaviour == 'crash' and job.attempts == 1:
+                # Walk away holding the lease; another worker must pick it up after expiry
+                continue
+            if behaviour == 'broken' or (behaviour == 'flaky' and job.attempts < 3):
+                await job_crud.fail(job, behaviour, retry_delay=0)
+                continue
+
+            await job_crud._collection.update_one({"_id": job.id}, {"$push": {"completed_by": worker_id}})
+            assert await job_crud.complete(job)
+
+
+def _run_queue_worker() -> None:
+    asyncio.run(_queue_worker())
+
+
+async def _enqueue(jobs) -> None:
+    async with DatabaseConfig.lifespan(MONGODB_URL, DB_NAME):
+        job_crud = ScrapeJobCRUD()
+        await job_crud.ensure_indexes()
+        for url, behaviour in jobs:
+            assert await job_crud.enqueue(JobKind.ARTICLE, NewsSource.OPENAI, url=url, payload={'behaviour': behaviour})
+        # Enqueueing the same URL again is a no-op
+        assert not await job_crud.enqueue(JobKind.ARTICLE, NewsSource.OPENAI, url=jobs[0][0])
+
+
+@pytest.fixture
+def database():
+    client = MongoClient(MONGODB_URL)
+    client.drop_database(DB_NAME)
+    yield client[DB_NAME]
+    client.drop_database(DB_NAME)
+    client.close()
+
+
+def test_jobs_survive_crashes_and_failures_across_processes(database):
+    jobs = [(f"https://openai.com/index/article-{i}", None) for i in range(40)]
+    jobs += [
+        ("https://openai.com/index/crash", 'crash'),
+        ("https://openai.com/index/flaky", 'flaky'),
+        ("https://openai.com/index/broken", 'broken'),
+    ]
+    asyncio.run(_enqueue(jobs))
+
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=_run_queue_worker) for _ in range(PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+        assert process.exitcode == 0
+
+    documents = {doc['url']: doc for doc in database.scrape_jobs.find()}
+    assert len(documents) == len(jobs)
+
+    for url, behaviour in jobs:
+        doc = documents[url]
+        if behaviour == 'broken':
+            assert doc['status'] == JobStatus.FAILED.value
+            assert doc['attempts'] == doc['max_attempts']
+            assert doc['last_error'] == 'broken'
+            assert 'completed_by' not in doc
+            continue
+
+        # Every other job is done, and by exactly one worker
+        assert doc['status'] == JobStatus.DONE.value
+        assert len(doc['completed_by']) == 1
+        assert doc['lease_expires_at'] is None
+        assert doc['attempts'] == {'crash': 2, 'flaky': 3}.get(behaviour, 1)
+
+
+def test_stale_lease_cannot_finish_a_reclaimed_job(database):
+    async def scenario():
+        async with DatabaseConfig.lifespan(MONGODB_URL, DB_NAME):
+            job_crud = ScrapeJobCRUD()
+            await job_crud.ensure_indexes()
+            await job_crud.enqueue(JobKind.LISTING, NewsSource.GROQ)
+
+            first = await job_crud.claim("first", LEASE_SECONDS)
+            assert await job_crud.claim("second", LEASE_SECONDS) is None
+            await asyncio.sleep(LEASE_SECONDS + 0.2)
+
+            second = await job_crud.claim("second", LEASE_SECONDS)
+            assert second is not None and second.attempts == 2
+            assert not await job_crud.heartbeat(first, LEASE_SECONDS)
+            assert not await job_crud.complete(first)
+            assert not await job_crud.fail(first, "stale")
+
+            assert await job_crud.complete(second)
+            # Completing twice is a no-op
+            assert not await job_crud.complete(second)
+            assert await job_crud.counts() == {JobStatus.DONE.value: 1}
+
+    asyncio.run(scenario())
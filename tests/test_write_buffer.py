@@ -0,0 +1,193 @@
+"""Write-behind buffer and store_articles() against an in-memory fake collection."""
+import asyncio
+
+import pytest
+from bson import ObjectId
+from pymongo import InsertOne
+from pymongo.errors import AutoReconnect, BulkWriteError, WriteError
+
+from src.database.base.write_buffer import WriteBehindBuffer
+from src.database.exceptions import WriteBufferClosedError
+from src.pipeline import store_articles
+
+
+class FakeCollection:
+    """Records bulk writes; `fail_indexes` maps operation index -> error code, `error` fails the whole call."""
+
+    def __init__(self, fail_indexes=None, error=None):
+        self.fail_indexes = fail_indexes or {}
+        self.error = error
+        self.calls = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.calls.append((list(operations), ordered))
+        if self.error is not None:
+            raise self.error
+        errors = [
+            {"index": index, "code": code, "errmsg": f"error {code}"}
+            for index, code in sorted(self.fail_indexes.items())
+        ]
+        if ordered:
+            errors = errors[:1]
+        if errors:
+            raise BulkWriteError({"writeErrors": errors})
+
+
+class FakeCRUD:
+    collection_name = "fake"
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.inserted = []
+
+    def _prepare_document(self, document):
+        return dict(document)
+
+    async def _on_inserted(self, documents):
+        self.inserted.extend(documents)
+
+
+class FakeArticleCRUD(FakeCRUD):
+    def __init__(self, collection, existing=()):
+        super().__init__(collection)
+        self.existing = set(existing)
+
+    def _prepare_document(self, document):
+        return document.model_dump(by_alias=True, exclude_none=True)
+
+    def write_buffer(self):
+        return WriteBehindBuffer(self, max_operations=500, flush_interval_ms=250)
+
+    async def existing_links(self, links):
+        return {link for link in links if link in self.existing}
+
+
+def _article(i):
+    return {
+        "article_source": "GROQ",
+        "article_name": f"Article {i}",
+        "article_link": f"https://groq.com/article-{i}",
+        "article_content": "Body",
+    }
+
+
+def test_unordered_bulk_error_fails_only_the_broken_items():
+    async def scenario():
+        crud = FakeCRUD(FakeCollection(fail_indexes={1: 11000}))
+        async with WriteBehindBuffer(crud) as buffer:
+            futures = [await buffer.create({"n": n}) for n in range(3)]
+
+        assert isinstance(await futures[0], ObjectId)
+        with pytest.raises(WriteError) as error:
+            await futures[1]
+        assert error.value.code == 11000
+        assert isinstance(await futures[2], ObjectId)
+        assert [doc["n"] for doc in crud.inserted] == [0, 2]
+
+    asyncio.run(scenario())
+
+
+def test_ordered_bulk_error_fails_everything_after_the_first_error():
+    async def scenario():
+        crud = FakeCRUD(FakeCollection(fail_indexes={1: 11000}))
+        async with WriteBehindBuffer(crud, ordered=True) as buffer:
+            futures = [await buffer.create({"n": n}) for n in range(3)]
+
+        await futures[0]
+        for future in futures[1:]:
+            with pytest.raises(Exception):
+                await future
+        assert crud._collection.calls[0][1] is True
+        assert [doc["n"] for doc in crud.inserted] == [0]
+
+    asyncio.run(scenario())
+
+
+def test_full_buffer_flushes_before_create_returns():
+    async def scenario():
+        crud = FakeCRUD(FakeCollection())
+        buffer = WriteBehindBuffer(crud, max_operations=2, flush_interval_ms=60_000)
+        first = await buffer.create({"n": 0})
+        assert not first.done() and len(buffer) == 1
+
+        second = await buffer.create({"n": 1})
+        assert first.done() and second.done() and len(buffer) == 0
+        assert len(crud._collection.calls) == 1
+        await buffer.close()
+
+    asyncio.run(scenario())
+
+
+def test_timer_flushes_without_close():
+    async def scenario():
+        crud = FakeCRUD(FakeCollection())
+        buffer = WriteBehindBuffer(crud, flush_interval_ms=10)
+        future = await buffer.create({"n": 0})
+        assert isinstance(await asyncio.wait_for(future, timeout=1), ObjectId)
+        assert len(crud._collection.calls) == 1
+        await buffer.close()
+        assert len(crud._collection.calls) == 1
+
+    asyncio.run(scenario())
+
+
+def test_close_flushes_pending_and_refuses_new_operations():
+    async def scenario():
+        crud = FakeCRUD(FakeCollection())
+        buffer = WriteBehindBuffer(crud, flush_interval_ms=60_000)
+        future = await buffer.create({"n": 0})
+        await buffer.update(ObjectId(), {"n": 1})
+        await buffer.close()
+
+        assert future.done()
+        operations, _ = crud._collection.calls[0]
+        assert len(operations) == 2 and isinstance(operations[0], InsertOne)
+        with pytest.raises(WriteBufferClosedError):
+            await buffer.create({"n": 2})
+
+    asyncio.run(scenario())
+
+
+def test_connection_error_reaches_every_future_and_close():
+    async def scenario():
+        crud = FakeCRUD(FakeCollection(error=AutoReconnect("connection reset")))
+        buffer = WriteBehindBuffer(crud, flush_interval_ms=60_000)
+        futures = [await buffer.create({"n": n}) for n in range(2)]
+        with pytest.raises(AutoReconnect):
+            await buffer.close()
+        for future in futures:
+            with pytest.raises(AutoReconnect):
+                await future
+        assert crud.inserted == []
+
+    asyncio.run(scenario())
+
+
+def test_store_articles_skips_duplicates_in_database_and_batch():
+    async def scenario():
+        crud = FakeArticleCRUD(FakeCollection(), existing={"https://groq.com/article-0"})
+        stats = await store_articles(crud, [_article(0), _article(1), _article(1), _article(2), {"article_name": "bad"}])
+        assert stats == {"inserted": 2, "duplicates": 2, "failed": 1}
+        operations, _ = crud._collection.calls[0]
+        assert len(operations) == 2
+
+    asyncio.run(scenario())
+
+
+def test_store_articles_counts_duplicate_key_errors_as_duplicates():
+    async def scenario():
+        crud = FakeArticleCRUD(FakeCollection(fail_indexes={0: 11000, 1: 121}))
+        stats = await store_articles(crud, [_article(0), _article(1), _article(2)])
+        assert stats == {"inserted": 1, "duplicates": 1, "failed": 1}
+
+    asyncio.run(scenario())
+
+
+def test_store_articles_survives_a_failed_flush():
+    async def scenario():
+        crud = FakeArticleCRUD(FakeCollection(error=AutoReconnect("connection reset")))
+        stats = await store_articles(crud, [_article(0), _article(1)])
+        assert stats == {"inserted": 0, "duplicates": 0, "failed": 2}
+
+    asyncio.run(scenario())
+